@@ -41,6 +41,14 @@ class ProductEnricher:
         
         total_enriched = 0
         
+        # Fetch every row's details up front, in parallel
+        self._prefetch_product_details(
+            [self._extract_product_url(row)
+             for table in enriched_data['tables']
+             for row in table.get('rows', [])],
+            use_selenium
+        )
+        
         for table_idx, table in enumerate(enriched_data['tables']):
             if 'rows' not in table:
                 continue
@@ -98,6 +106,18 @@ class ProductEnricher:
         
         return None
     
+    def _prefetch_product_details(self, product_urls: List[str], use_selenium: bool = False):
+        """Fetch details for all uncached URLs concurrently and store them in the cache"""
+        pending = [url for url in product_urls if url and url not in self.cache]
+        if not pending:
+            return
+        
+        try:
+            self.cache.update(self.scraper.fetch_product_details_batch(pending, use_selenium))
+        except Exception as e:
+            # Rows fall back to fetching one at a time
+            logger.error(f"Error prefetching product details: {e}")
+    
     def _get_product_details(self, product_url: str, use_selenium: bool = False) -> Dict:
         """Get product details from cache or fetch"""
         # Check cache
@@ -126,6 +146,14 @@ class ProductEnricher:
         """
         enriched_products = []
         
+        # Fetch details for products still missing an image or description, in parallel
+        self._prefetch_product_details(
+            [product.get('source_url') or product.get('url')
+             for product in products
+             if not (product.get('image_url') and product.get('description'))],
+            use_selenium
+        )
+        
         for product in products:
             enriched = product.copy()
             
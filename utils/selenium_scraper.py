@@ -114,17 +114,14 @@ class SeleniumScraper:
             logger.error(f"Failed to initialize Selenium WebDriver: {e}")
             raise
     
-    def get_page(self, url: str, wait_for_selector: Optional[str] = None, wait_time: int = 10) -> BeautifulSoup:
+    def load_page(self, url: str, wait_for_selector: Optional[str] = None, wait_time: int = 10):
         """
-        Load a page and return BeautifulSoup object
+        Load a page without parsing it (use when the caller reads driver.page_source itself)
         
         Args:
             url: URL to load
             wait_for_selector: Optional CSS selector to wait for before returning
             wait_time: Maximum wait time in seconds
-            
-        Returns:
-            BeautifulSoup object of the page
         """
         if not self.driver:
             self._init_driver()
@@ -145,12 +142,6 @@ class SeleniumScraper:
             # Wait for page to be ready
             time.sleep(2)  # Additional wait for JavaScript
             
-            # Get page source and parse
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            return soup
-            
         except TimeoutException:
             logger.error(f"Timeout loading page: {url}")
             raise
@@ -158,6 +149,26 @@ class SeleniumScraper:
             logger.error(f"Error loading page {url}: {e}")
             raise
     
+    def get_page(self, url: str, wait_for_selector: Optional[str] = None, wait_time: int = 10) -> BeautifulSoup:
+        """
+        Load a page and return BeautifulSoup object
+        
+        Args:
+            url: URL to load
+            wait_for_selector: Optional CSS selector to wait for before returning
+            wait_time: Maximum wait time in seconds
+            
+        Returns:
+            BeautifulSoup object of the page
+        """
+        self.load_page(url, wait_for_selector=wait_for_selector, wait_time=wait_time)
+        
+        # Get page source and parse
+        page_source = self.driver.page_source
+        soup = BeautifulSoup(page_source, 'html.parser')
+        
+        return soup
+    
     def find_elements(self, by: By, value: str) -> List:
         """Find elements using Selenium"""
         if not self.driver:
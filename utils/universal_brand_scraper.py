@@ -4,13 +4,24 @@ Combines multiple detection strategies with intelligent fallbacks
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+import soupsieve
+import lxml.html
+from lxml import etree
 import logging
 import time
 import re
+import hashlib
+import threading
 import urllib.robotparser
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin, urlparse
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -30,6 +41,254 @@ try:
 except ImportError:
     ARCHITONIC_AVAILABLE = False
 
+# Parser for every BeautifulSoup tree built here (see UniversalBrandScraper._soup)
+_HTML_PARSER = 'lxml'
+
+# Precompiled patterns shared by every page parsed
+_RE_HTML_CONTENT_TYPE = re.compile(r'(text/|html|xml)', re.I)
+# robots.txt Request-rate with a time unit ("2/1s", "1/10m"), which urllib.robotparser rejects
+_RE_REQUEST_RATE_UNIT = re.compile(r'^(?P<head>\s*request-rate\s*:\s*\d+\s*/\s*)(?P<num>\d+)\s*(?P<unit>[smh])\b.*$', re.I)
+_TIME_UNIT_SECONDS = {'s': 1, 'm': 60, 'h': 3600}
+# JS-rendering markers, checked on raw HTML bytes before any parsing
+_RE_JS_ROOT_HTML = re.compile(rb'<div\b[^>]*(?<![\w-])id\s*=\s*["\']?[^"\'\s>]*(root|app|react)', re.I)
+_RE_JS_LIB_HTML = re.compile(rb'<script\b[^>]*(?<![\w-])src\s*=\s*["\']?[^"\'\s>]*(react|vue|angular)', re.I)
+_RE_SUB = re.compile(r'(sub|dropdown|child)', re.I)
+_RE_MENU = re.compile(r'menu', re.I)
+# Any of these present means the listing has started rendering (see _wait_for_products)
+_PRODUCT_READY_SELECTOR = '.product-card, .product, [class*="product"]'
+_RE_PAGE_NUMBER = re.compile(r'(?:[?&](?:page|paged|pg)=|/page/)(?P<num>\d+)', re.I)
+_RE_PAGE_PATH_SEGMENT = re.compile(r'/page/\d+', re.I)
+# Whole class ending in excerpt/description (product-excerpt, woocommerce-product-details__short-description),
+# not wrappers such as astra-shop-summary-wrap
+_RE_TILE_DESCRIPTION = re.compile(r'(?:^|[\s_-])(?:excerpt|description)(?=\s|$)', re.I)
+_RE_GRID_DIV = re.compile(r'(category|collection|product-cat)', re.I)
+_RE_GRID_ITEM = re.compile(r'(category|collection)', re.I)
+_RE_FOOTER = re.compile(r'footer', re.I)
+
+# CSS selectors are compiled once here; soup.select() would re-resolve the pattern on every call
+
+# Links inside <nav>, menu-like <div>s and menu-like lists
+_NAV_LINK_SELECTOR = soupsieve.compile(', '.join(
+    f'{container} a[href]' for container in (
+        'nav',
+        'div[class*="nav" i]', 'div[class*="menu" i]', 'div[class*="header" i]',
+        'ul[class*="nav" i]', 'ul[class*="menu" i]',
+    )
+))
+
+# Typology detection works on an lxml tree (see _detect_typology_categories)
+_GENERIC_LINK_TEXTS = frozenset(('find out more', 'read more', 'view', 'see more', ''))
+_XP_TYPOLOGY = etree.XPath(
+    "//a[contains(translate(@href, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '/typologies/')]"
+)
+_XP_PARENT_CONTAINER = etree.XPath('ancestor::*[self::div or self::article or self::section or self::li][1]')
+_XP_HEADING = etree.XPath('descendant::*[self::h1 or self::h2 or self::h3 or self::h4 or self::h5 or self::h6][1]')
+
+# Top-level nav entries whose submenu markup is already in the DOM (see _detect_submenus_from_source)
+_XP_NAV_MENU_ITEMS = etree.XPath('//nav//li[a and .//ul//a[@href]][not(ancestor::li)]')
+_XP_MENU_ITEM_LINK = etree.XPath('a[1]')
+_XP_SUBMENU_LINKS = etree.XPath('.//ul//a[@href]')
+
+# Category link filtering (see _is_category_link), one alternation per list
+# Plain string checks run first; the regex still catches these anywhere in the href/text
+_CATEGORY_EXCLUDE_PREFIXES = ('#', 'javascript:', 'mailto:', 'tel:')
+_CATEGORY_EXCLUDE_EXTENSIONS = ('.pdf', '.jpg', '.png', '.gif', '.zip')
+_RE_CATEGORY_EXCLUDE = re.compile('|'.join((
+    r'javascript:', r'mailto:', r'tel:',
+    r'(login|register|account|cart|checkout|contact|about|faq)',
+    r'(facebook|twitter|instagram|linkedin|youtube)',
+    r'\.(pdf|jpg|png|gif|zip)'
+)), re.I)
+_RE_CATEGORY_INCLUDE = re.compile('|'.join((
+    r'(category|collection|product|shop|furniture)',
+    r'(chair|desk|table|sofa|storage|office)'
+)), re.I)
+
+# Product listing containers in tiers, WooCommerce first, then generic (see _extract_products_from_page)
+# Each tier is one selector group, so it costs a single tree walk
+_PRODUCT_CONTAINER_TIERS = tuple(soupsieve.compile(tier) for tier in (
+    # WooCommerce specific (li or div)
+    'li[class~="product" i], li[class*="type-product" i], '
+    'div[class~="product" i], div[class*="type-product" i], '
+    'div[class*="product-grid-item" i], div[class*="product-item" i]',
+    
+    # Generic product containers
+    'div[class*="product-card" i], article[class*="product" i], '
+    'div[class*="item" i][class*="product" i], div[class*="card" i][class*="product" i]',
+    
+    # Fallback
+    'div[class*="item" i], div[class*="card" i]',
+))
+
+# Description blocks on product detail pages, most specific first (see _extract_description)
+_DESCRIPTION_SELECTORS = tuple(soupsieve.compile(selector) for selector in (
+    'div.entry-content',
+    'div.product-content',
+    'div.content p',
+    'article p',
+    'section.product-description',
+    'div.description',
+    'div.woocommerce-product-details__short-description',
+    'div.product-short-description',
+    'div[itemprop="description"]',
+    'div#tab-description',
+    'div.woocommerce-Tabs-panel--description'
+))
+
+# Product tile filtering (see _extract_product_from_container)
+_CATEGORY_URL_MARKERS = ('/product-category/', '/category/', '/typologies/')
+_RE_CATEGORY_URL = re.compile('|'.join(map(re.escape, _CATEGORY_URL_MARKERS)), re.I)
+# Group 2 is set only when the URL goes deeper than /typologies/<name>
+_RE_TYPOLOGY_DEPTH = re.compile(r'/typologies/+([^/]+)?(/+[^/].*)?', re.I)
+_NAV_KEYWORDS = (
+    'open submenu', 'close submenu', 'toggle', 'menu', 'back',
+    'search', 'cart', 'account', 'login', 'register', 'checkout',
+    'view all', 'read more', 'select options', 'add to cart',
+    'filter', 'sort', 'previous', 'next'
+)
+_RE_NAV_KEYWORDS = re.compile('|'.join(map(re.escape, _NAV_KEYWORDS)), re.I)
+
+# Product tile and detail page fields
+_TITLE_TAGS = frozenset(('h2', 'h3', 'h4', 'a', 'span', 'div'))
+_TILE_HEADING_TAGS = ('h2', 'h3', 'h4', 'h5')  # Fallback title, in priority order
+_PRICE_TAGS = frozenset(('span', 'div'))
+_TILE_DESCRIPTION_TAGS = frozenset(('p', 'div', 'span'))
+_RE_TITLE_CLASS = re.compile(r'(title|name|product.*name|woocommerce-loop-product__title)', re.I)
+_RE_PRICE_CLASS = re.compile(r'price', re.I)
+_RE_PRICE = re.compile(r'[\d,.]+')
+_RE_FEATURE_LIST = re.compile(r'(feature|spec|benefit|specification)', re.I)
+_RE_SPEC_TABLE = re.compile(r'(spec|feature|detail)', re.I)
+_RE_MAIN_CONTENT = re.compile(r'content|main', re.I)
+# Shop/UI boilerplate stripped from descriptions (see _extract_description)
+_RE_UNWANTED_DESC = re.compile(
+    r'add to cart|add to wishlist|share:|sku:|categories:|tags:|read more|view all', re.I
+)
+_RE_PRODUCT_DESCRIPTION = re.compile(r'product.*description', re.I)
+_RE_DESCRIPTION = re.compile(r'description', re.I)
+_RE_PRODUCT_CONTENT = re.compile(r'product.*content', re.I)
+_RE_PRODUCT_IMAGE = re.compile(r'product.*image', re.I)
+_RE_PRODUCT_GALLERY = re.compile(r'product.*gallery', re.I)
+_RE_PRODUCT = re.compile(r'product', re.I)
+
+# fetch_product_details lookups, tried in order; each find only runs if the previous one missed
+_DETAIL_DESCRIPTION_LOOKUPS = (
+    ('div', {'class': _RE_PRODUCT_DESCRIPTION}),
+    ('div', {'class': _RE_DESCRIPTION}),
+    ('div', {'id': _RE_DESCRIPTION}),
+    ('div', {'class': _RE_PRODUCT_CONTENT}),
+)
+_DETAIL_IMAGE_LOOKUPS = (
+    ('img', {'class': _RE_PRODUCT_IMAGE}),
+    ('div', {'class': _RE_PRODUCT_GALLERY}),
+    ('figure', {'class': _RE_PRODUCT}),
+)
+_DETAIL_PRICE_LOOKUPS = (
+    ('span', {'class': _RE_PRICE_CLASS}),
+    ('div', {'class': _RE_PRICE_CLASS}),
+    ('p', {'class': _RE_PRICE_CLASS}),
+)
+
+# Breadcrumb containers (see extract_breadcrumb_links); class matches are tried before id matches
+_RE_BREADCRUMB_CLASS = re.compile(r'(breadcrumb|bread-crumb|path)', re.I)
+_RE_BREADCRUMB_ID = re.compile(r'(breadcrumb)', re.I)
+_BREADCRUMB_CONTAINER_SELECTORS = (
+    soupsieve.compile(', '.join(
+        f'{tag}[class*="{word}" i]'
+        for tag in ('nav', 'div', 'ul', 'ol')
+        for word in ('breadcrumb', 'bread-crumb', 'path')
+    )),
+    soupsieve.compile('div[id*="breadcrumb" i]'),
+)
+_BREADCRUMB_SKIP_TEXT = frozenset(('Home', '>', '/', '»'))
+
+# Category name cleanup (see _clean_category_name)
+_RE_SUBMENU_PREFIX = re.compile(r'^(Open|Close)\s+submenu\s*[\(\[]?', re.I)
+_RE_TRAILING_BRACKET = re.compile(r'[\)\]]$')
+_RE_TOGGLE_PREFIX = re.compile(r'^Toggle\s+', re.I)
+_RE_COUNT_SUFFIX = re.compile(r'\s*\(\d+\)$')
+_RE_NAV_ARTIFACT_PREFIX = re.compile(r'^(View|See|Show|All)\s+', re.I)
+
+
+def _element_text(element) -> str:
+    """Text of an lxml element, stripped and joined like BeautifulSoup's get_text(strip=True)"""
+    return ''.join(text.strip() for text in element.itertext())
+
+
+def _listing_path(url: str) -> str:
+    """Path of the listing a (possibly paginated) URL belongs to: /shop/page/3/ -> /shop"""
+    return _RE_PAGE_PATH_SEGMENT.sub('', urlparse(url).path).rstrip('/')
+
+
+def _is_breadcrumb_container(name, attrs=None) -> bool:
+    """Parse-time test for the containers extract_breadcrumb_links looks at (used as a SoupStrainer)"""
+    attrs = attrs or {}
+    if name in ('nav', 'div', 'ul', 'ol') and _RE_BREADCRUMB_CLASS.search(attrs.get('class') or ''):
+        return True
+    return name == 'div' and bool(_RE_BREADCRUMB_ID.search(attrs.get('id') or ''))
+
+
+# Keeps only breadcrumb containers (and their links) when a page is parsed just for its breadcrumbs
+_BREADCRUMB_STRAINER = SoupStrainer(_is_breadcrumb_container)
+
+
+@lru_cache(maxsize=4096)
+def _is_category_link_cached(href: str, text: str) -> bool:
+    """Determine if a link is likely a category (pure, memoized on (href, text))"""
+    if not href or not text:
+        return False
+
+    # Exclude common non-category links (anchors/scripts/mail/phone/files are the usual case)
+    if href.startswith(_CATEGORY_EXCLUDE_PREFIXES) or href.lower().endswith(_CATEGORY_EXCLUDE_EXTENSIONS):
+        return False
+    if '#' in href or '#' in text:
+        return False
+    if _RE_CATEGORY_EXCLUDE.search(href) or _RE_CATEGORY_EXCLUDE.search(text):
+        return False
+
+    # Include category-like patterns
+    if _RE_CATEGORY_INCLUDE.search(href):
+        return True
+    # Check text length (categories usually have short names)
+    return 2 <= len(text) <= 50
+
+
+@lru_cache(maxsize=4096)
+def _clean_category_name_cached(name: str) -> str:
+    """Clean up category name (e.g. 'Open submenu (Chairs)' -> 'Chairs'), memoized"""
+    if not name:
+        return ""
+
+    # Normalize whitespace
+    name = " ".join(name.split())
+
+    # Remove "Open/Close submenu" prefixes/suffixes
+    # Matches: "Open submenu", "Close submenu", "Open submenu (Chairs)", "Close submenu [Chairs]"
+    name = _RE_SUBMENU_PREFIX.sub('', name)
+    name = _RE_TRAILING_BRACKET.sub('', name)
+
+    # Remove "Toggle" prefix
+    name = _RE_TOGGLE_PREFIX.sub('', name)
+
+    # Remove counts (e.g. "Chairs (10)")
+    name = _RE_COUNT_SUFFIX.sub('', name)
+
+    # Remove common navigation artifacts
+    name = _RE_NAV_ARTIFACT_PREFIX.sub('', name)
+
+    return name.strip()
+
+
+class _RobotFileParser(urllib.robotparser.RobotFileParser):
+    """RobotFileParser that also understands Request-rate values with a time unit"""
+    
+    def parse(self, lines):
+        super().parse([_RE_REQUEST_RATE_UNIT.sub(self._rate_in_seconds, line) for line in lines])
+    
+    @staticmethod
+    def _rate_in_seconds(match) -> str:
+        seconds = int(match.group('num')) * _TIME_UNIT_SECONDS[match.group('unit').lower()]
+        return f"{match.group('head')}{seconds}"
+
 
 class CategoryTreeBuilder:
     """Builds and validates category hierarchy to eliminate duplicates"""
@@ -90,22 +349,28 @@ class CategoryTreeBuilder:
             else:
                 parent_map[parent]['parent'] = coll_name
         
+        # Index subcategory products once: URL -> parent categories whose subcategories list it
+        url_to_parents = {}
+        for parent, info in parent_map.items():
+            for child in info['children']:
+                for url in product_urls.get(child, ()):
+                    url_to_parents.setdefault(url, set()).add(parent)
+        
         # Check for duplicates
         for parent, info in parent_map.items():
-            if info['parent'] and info['children']:
-                parent_urls = product_urls.get(info['parent'], set())
-                
-                # Combine all child URLs
-                child_urls = set()
-                for child in info['children']:
-                    child_urls.update(product_urls.get(child, set()))
-                
-                # If parent has same products as children, it's a duplicate
-                if parent_urls and child_urls:
-                    overlap = len(parent_urls & child_urls) / len(parent_urls) if parent_urls else 0
-                    if overlap > 0.8:  # 80% overlap threshold
-                        logger.info(f"Detected duplicate category: '{info['parent']}' (80%+ overlap with subcategories)")
-                        duplicates.append(info['parent'])
+            if not info['parent'] or not info['children']:
+                continue
+            
+            parent_urls = product_urls.get(info['parent'])
+            if not parent_urls:
+                continue
+            
+            # If parent has same products as children, it's a duplicate
+            hits = sum(1 for url in parent_urls if parent in url_to_parents.get(url, ()))
+            overlap = hits / len(parent_urls)
+            if overlap > 0.8:  # 80% overlap threshold
+                logger.info(f"Detected duplicate category: '{info['parent']}' (80%+ overlap with subcategories)")
+                duplicates.append(info['parent'])
         
         return duplicates
     
@@ -129,6 +394,10 @@ class CategoryTreeBuilder:
 class UniversalBrandScraper:
     """Universal scraper that adapts to different website structures"""
     
+    # robots.txt parsers shared across instances, keyed by host
+    _robots_cache: Dict[str, urllib.robotparser.RobotFileParser] = {}
+    _robots_lock = threading.Lock()
+    
     def __init__(self):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -137,34 +406,176 @@ class UniversalBrandScraper:
         
         # Enhanced configuration
         self.config = {
-            'parallel_collections': False,  # Disabled by default for stability
+            'parallel_collections': True,  # Cache and per-host rate limiter are thread-safe
             'max_workers': 3,
             'enable_caching': True,
+            'cache_max_pages': 256,  # LRU bound for _page_cache
+            'cache_max_bytes': 64 * 1024 * 1024,  # Total size bound for cached page HTML
+            'cache_ttl': 3600,  # Seconds before a cached page is fetched again
             'smart_pagination': True,
             'detect_general_category': True,  # Eliminate "general" duplicates
             'min_products_per_category': 1,
             'max_pagination_depth': 10,
-            'hierarchy_validation': True
+            'hierarchy_validation': True,
+            'connect_timeout': 5,  # Fail fast on unreachable hosts
+            'read_timeout': 15,
+            'http_retries': 2  # Retries for connect errors and 5xx responses (never read timeouts)
         }
         
         # Initialize tree builder
         self.tree_builder = CategoryTreeBuilder()
-        self._page_cache = {}  # Cache for repeated page requests
+        self._page_cache = OrderedDict()  # key -> (stored_at, value, size), LRU order
+        self._page_cache_bytes = 0  # Sum of the sizes in _page_cache
+        self._cache_lock = threading.Lock()
+        
+        # Shared HTTP session - pool sized so every worker keeps its own connection alive,
+        # with a short backoff retry so one flaky 5xx does not empty a whole collection.
+        # Read timeouts are not retried (read=False): a stalled host must fail fast, not tie up a worker
+        self._http_session = requests.Session()
+        self._http_session.headers.update(self.headers)
+        retry = Retry(total=self.config['http_retries'], read=False, backoff_factor=0.3,
+                      status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=self.config['max_workers'],
+                              pool_maxsize=self.config['max_workers'],
+                              max_retries=retry)
+        self._http_session.mount('http://', adapter)
+        self._http_session.mount('https://', adapter)
+        
+        # Per-host rate limiting: host -> earliest time the next request may start
+        self._host_next_slot = {}
+        self._host_delays = {}  # host -> delay requested by robots.txt (Crawl-delay / Request-rate)
+        self._rate_lock = threading.Lock()
     
     def check_robots_allowed(self, website: str) -> bool:
-        """Check if scraping is allowed by robots.txt"""
+        """Check if scraping is allowed by robots.txt (fetched once per host)"""
         try:
-            rp = urllib.robotparser.RobotFileParser()
-            robots_url = urljoin(website, '/robots.txt')
-            rp.set_url(robots_url)
-            rp.read()
+            host = urlparse(website).netloc
+            with self._robots_lock:
+                rp = self._robots_cache.get(host)
+            
+            if rp is None:
+                rp = _RobotFileParser()
+                robots_url = urljoin(website, '/robots.txt')
+                rp.set_url(robots_url)
+                rp.read()
+                with self._robots_lock:
+                    self._robots_cache[host] = rp
+            
+            # Honour Crawl-delay / Request-rate for this host
+            user_agent = self.headers['User-Agent']
+            delay = rp.crawl_delay(user_agent) or 0
+            rate = rp.request_rate(user_agent)
+            if rate and rate.requests:
+                delay = max(delay, rate.seconds / rate.requests)
+            if delay > 0:
+                logger.info(f"robots.txt asks for {delay}s between requests to {host}")
+                self._host_delays[host] = float(delay)
             
             # Check if our user agent can fetch the site
-            return rp.can_fetch(self.headers['User-Agent'], website)
+            return rp.can_fetch(user_agent, website)
         except Exception as e:
             logger.warning(f"Could not read robots.txt: {e}")
             return True  # Allow by default if robots.txt is not accessible
     
+    def _wait_for_rate_limit(self, url: str, detail_page: bool = False):
+        """
+        Block until a request to url's host is allowed
+        Each host gets one request slot per rate_limit_delay (or the robots.txt delay, if longer),
+        shared by all worker threads. Product detail pages are only spaced by the robots.txt
+        delay - the worker pool already bounds how many of them are in flight
+        """
+        host = urlparse(url).netloc
+        delay = max(self._host_delays.get(host, 0), 0 if detail_page else self.rate_limit_delay)
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._host_next_slot.get(host, now))
+            self._host_next_slot[host] = slot + delay
+        
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def _cache_get(self, key) -> Optional[Any]:
+        """Return a cached value (marking it recently used), or None if missing or expired"""
+        if not self.config.get('enable_caching'):
+            return None
+        
+        with self._cache_lock:
+            entry = self._page_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, value, size = entry
+            if time.monotonic() - stored_at > self.config.get('cache_ttl', 3600):
+                del self._page_cache[key]
+                self._page_cache_bytes -= size
+                return None
+            self._page_cache.move_to_end(key)
+            return value
+    
+    def _cache_put(self, key, value):
+        """Store a value, evicting the least recently used entries beyond cache_max_pages/cache_max_bytes"""
+        if not self.config.get('enable_caching'):
+            return
+        
+        # Page HTML dominates memory; extracted product lists are small and count as nothing
+        size = len(value) if isinstance(value, (bytes, str)) else 0
+        max_pages = self.config.get('cache_max_pages', 256)
+        max_bytes = self.config.get('cache_max_bytes', 64 * 1024 * 1024)
+        
+        with self._cache_lock:
+            previous = self._page_cache.pop(key, None)
+            if previous is not None:
+                self._page_cache_bytes -= previous[2]
+            if size > max_bytes:
+                return  # Would evict everything else and still not fit
+            
+            self._page_cache[key] = (time.monotonic(), value, size)
+            self._page_cache_bytes += size
+            while len(self._page_cache) > max_pages or self._page_cache_bytes > max_bytes:
+                _, (_, _, evicted_size) = self._page_cache.popitem(last=False)
+                self._page_cache_bytes -= evicted_size
+    
+    def _get_html(self, url: str, detail_page: bool = False) -> bytes:
+        """Fetch a page's raw HTML through the cache, rate limiter and shared session"""
+        html = self._cache_get(url)
+        if html is not None:
+            logger.debug("Using cached page for %s", url)
+            return html
+        
+        self._wait_for_rate_limit(url, detail_page=detail_page)
+        # Streamed, so the body of a PDF/image/archive linked from a menu is never downloaded
+        with self._http_session.get(url, timeout=self._http_timeout(), stream=True) as response:
+            content_type = response.headers.get('Content-Type', '')
+            if content_type and not _RE_HTML_CONTENT_TYPE.search(content_type):
+                logger.debug("Skipping non-HTML response (%s) for %s", content_type, url)
+                html = b''
+            else:
+                html = response.content
+            cacheable = response.ok  # An error page (or a 503 still failing after retries) is not the page
+        if cacheable:
+            self._cache_put(url, html)
+        return html
+    
+    def _get_rendered_html(self, scraper: SeleniumScraper, url: str, wait_time: int) -> str:
+        """Load a page in Selenium and return its rendered HTML, reusing an earlier render if cached"""
+        key = (url, 'selenium')
+        html = self._cache_get(key)
+        if html is not None:
+            logger.debug("Using cached render for %s", url)
+            return html
+        
+        scraper.load_page(url, wait_time=wait_time)
+        html = scraper.driver.page_source
+        self._cache_put(key, html)
+        return html
+    
+    def _soup(self, html, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse HTML with the C-backed parser used throughout this module"""
+        return BeautifulSoup(html, _HTML_PARSER, parse_only=parse_only)
+    
+    def _http_timeout(self) -> Tuple[float, float]:
+        """(connect, read) timeout so a stalled host cannot hold a worker for the full read budget"""
+        return (self.config.get('connect_timeout', 5), self.config.get('read_timeout', 15))
+    
     def scrape_brand_website(self, website: str, brand_name: str, use_selenium: bool = True) -> Dict:
         """
         Main entry point - intelligently scrapes any brand website
@@ -186,73 +597,70 @@ class UniversalBrandScraper:
         needs_js = use_selenium or self._detect_javascript_required(website)
         
         if needs_js and SELENIUM_AVAILABLE:
-            return self._scrape_with_selenium(website, brand_name)
+            result = self._scrape_with_selenium(website, brand_name)
         else:
-            return self._scrape_with_requests(website, brand_name)
+            result = self._scrape_with_requests(website, brand_name)
+        
+        self._log_memo_stats()
+        return result
+    
+    def _log_memo_stats(self):
+        """Log hit rates of the category link/name memo caches (process-wide, cumulative)"""
+        for name, memo in (('category link', _is_category_link_cached),
+                           ('category name', _clean_category_name_cached)):
+            info = memo.cache_info()
+            lookups = info.hits + info.misses
+            if lookups:
+                logger.debug("%s cache: %d/%d hits (%.0f%%), %d/%d entries", name, info.hits, lookups,
+                             100 * info.hits / lookups, info.currsize, info.maxsize)
     
     def _detect_javascript_required(self, website: str) -> bool:
         """Detect if website requires JavaScript"""
         try:
-            response = requests.get(website, headers=self.headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Check for common JS framework indicators
-            js_indicators = [
-                soup.find('div', id=re.compile(r'(root|app|react)', re.I)),
-                soup.find('script', src=re.compile(r'(react|vue|angular)', re.I)),
-                len(soup.find_all('div')) < 10  # Very sparse HTML
-            ]
-            
-            return any(js_indicators)
+            return self._looks_javascript_rendered(self._get_html(website))
         except:
             return True  # Default to Selenium if unsure
     
+    def _looks_javascript_rendered(self, html: bytes) -> bool:
+        """Whether raw HTML looks like a client-rendered app shell rather than a complete page"""
+        # Check for common JS framework indicators on the raw HTML first
+        if _RE_JS_ROOT_HTML.search(html) or _RE_JS_LIB_HTML.search(html):
+            return True
+        
+        # Inconclusive - parse only the <div>s to check for very sparse HTML
+        divs = self._soup(html, parse_only=SoupStrainer('div'))
+        return len(divs.find_all('div')) < 10
+    
     def _scrape_with_requests(self, website: str, brand_name: str) -> Dict:
         """Scrape using requests - for static sites"""
+        dedup_enabled = self.config.get('detect_general_category', True)
+        
         try:
-            response = requests.get(website, headers=self.headers, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            collections = self._detect_hierarchy_universal(soup, website)
-            
-            result = {
-                'brand': brand_name,
-                'source': 'Brand Website',
-                'scraped_at': datetime.now().isoformat(),
-                'total_products': 0,
-                'total_collections': len(collections),
-                'collections': {},
-                'all_products': []
-            }
+            html = self._get_html(website)
+            soup = self._soup(html)
+            
+            collections = self._detect_hierarchy_universal(soup, website, html)
+            
+            result = self._new_result(brand_name, 'Brand Website', total_collections=len(collections))
+            collection_results = result['collections']
             
             all_products = []
+            scraped = self._scrape_collections(collections, brand_name)
             
             for coll_name, coll_info in collections.items():
-                logger.info(f"Scraping collection: {coll_name}")
-                time.sleep(self.rate_limit_delay)
-                
-                products = self._scrape_collection_universal(
-                    coll_info['url'], brand_name, coll_info
-                )
+                products = scraped[coll_name]
                 
-                result['collections'][coll_name] = {
-                    'url': coll_info['url'],
-                    'category': coll_info.get('category'),
-                    'subcategory': coll_info.get('subcategory'),
-                    'product_count': len(products),
-                    'products': products
-                }
+                collection_results[coll_name] = self._collection_entry(coll_info, products)
                 all_products.extend(products)
             
             # Apply cross-collection deduplication if enabled
-            if self.config.get('detect_general_category', True) and len(result['collections']) > 1:
+            if dedup_enabled and len(result['collections']) > 1:
                 logger.info("Applying cross-collection deduplication...")
-                result['collections'] = self._cross_collection_deduplicate(result['collections'])
+                result['collections'], removed = self._cross_collection_deduplicate(result['collections'])
                 
-                # Rebuild all_products list
-                all_products = []
-                for coll_data in result['collections'].values():
-                    all_products.extend(coll_data.get('products', []))
+                # Drop the discarded copies from all_products
+                if removed:
+                    all_products = [p for p in all_products if id(p) not in removed]
             
             result['all_products'] = all_products
             result['total_products'] = len(all_products)
@@ -266,41 +674,37 @@ class UniversalBrandScraper:
     
     def _scrape_with_selenium(self, website: str, brand_name: str) -> Dict:
         """Scrape using Selenium - for dynamic sites"""
+        dedup_enabled = self.config.get('detect_general_category', True)
         scraper = SeleniumScraper(headless=True, timeout=60)
         
         try:
             logger.info(f"Loading with Selenium: {website}")
-            soup = scraper.get_page(website, wait_time=15)
-            scraper.scroll_to_bottom(pause_time=2.0)
-            time.sleep(3)
-            
-            soup = BeautifulSoup(scraper.driver.page_source, 'html.parser')
+            # Browser page loads share the per-host limiter, so robots.txt Crawl-delay applies here too
+            self._wait_for_rate_limit(website)
+            scraper.load_page(website, wait_time=15)
+            # scroll_to_bottom only returns once the page height has stopped growing
+            scraper.scroll_to_bottom(pause_time=1.0)
+            time.sleep(0.5)
             
             # Detect dynamic submenus using Selenium hover (for dropdown menus)
             logger.info("Detecting dynamic submenus with Selenium hover...")
             dynamic_collections = self._detect_dynamic_submenus_with_selenium(scraper, website)
-            time.sleep(1)  # Wait for any animations
+            time.sleep(0.5)  # Let the last menu close
             
-            # Get updated page source after revealing submenus
-            soup = BeautifulSoup(scraper.driver.page_source, 'html.parser')
+            # Parse the page once, after submenus have been revealed
+            page_source = scraper.driver.page_source
+            soup = self._soup(page_source)
             
             # Detect hierarchy using multiple strategies
-            collections = self._detect_hierarchy_universal(soup, website)
+            collections = self._detect_hierarchy_universal(soup, website, page_source)
             
             # Merge dynamic collections with initial collections
             if dynamic_collections:
                 logger.info(f"Merging {len(dynamic_collections)} dynamic subcategories with {len(collections)} initial collections")
                 collections.update(dynamic_collections)
             
-            result = {
-                'brand': brand_name,
-                'source': 'Brand Website (Selenium)',
-                'scraped_at': datetime.now().isoformat(),
-                'total_products': 0,
-                'total_collections': len(collections),
-                'collections': {},
-                'all_products': []
-            }
+            result = self._new_result(brand_name, 'Brand Website (Selenium)', total_collections=len(collections))
+            collection_results = result['collections']
             
             all_products = []
             
@@ -312,19 +716,13 @@ class UniversalBrandScraper:
             initial_collections = list(collections.items())
             for coll_name, coll_info in initial_collections:
                 logger.info(f"Scraping collection: {coll_name}")
-                time.sleep(self.rate_limit_delay)
+                self._wait_for_rate_limit(coll_info['url'])
                 
                 products = self._scrape_collection_with_selenium(
                     scraper, coll_info['url'], brand_name, coll_info
                 )
                 
-                result['collections'][coll_name] = {
-                    'url': coll_info['url'],
-                    'category': coll_info.get('category'),
-                    'subcategory': coll_info.get('subcategory'),
-                    'product_count': len(products),
-                    'products': products
-                }
+                collection_results[coll_name] = self._collection_entry(coll_info, products)
                 all_products.extend(products)
             
             # Discovery pass: Check for subcategories if none were found
@@ -357,30 +755,23 @@ class UniversalBrandScraper:
                     logger.info(f"Scraping {len(new_collections)} discovered subcategories...")
                     for coll_name, coll_info in new_collections.items():
                         logger.info(f"Scraping subcategory: {coll_name}")
-                        time.sleep(self.rate_limit_delay)
+                        self._wait_for_rate_limit(coll_info['url'])
                         
                         products = self._scrape_collection_with_selenium(
                             scraper, coll_info['url'], brand_name, coll_info
                         )
                         
-                        result['collections'][coll_name] = {
-                            'url': coll_info['url'],
-                            'category': coll_info.get('category'),
-                            'subcategory': coll_info.get('subcategory'),
-                            'product_count': len(products),
-                            'products': products
-                        }
+                        collection_results[coll_name] = self._collection_entry(coll_info, products)
                         all_products.extend(products)
             
             # Apply cross-collection deduplication if enabled
-            if self.config.get('detect_general_category', True) and len(result['collections']) > 1:
+            if dedup_enabled and len(result['collections']) > 1:
                 logger.info("Applying cross-collection deduplication...")
-                result['collections'] = self._cross_collection_deduplicate(result['collections'])
+                result['collections'], removed = self._cross_collection_deduplicate(result['collections'])
                 
-                # Rebuild all_products list
-                all_products = []
-                for coll_data in result['collections'].values():
-                    all_products.extend(coll_data.get('products', []))
+                # Drop the discarded copies from all_products
+                if removed:
+                    all_products = [p for p in all_products if id(p) not in removed]
             
             result['all_products'] = all_products
             result['total_products'] = len(all_products)
@@ -397,72 +788,219 @@ class UniversalBrandScraper:
     def _scrape_collection_with_selenium(self, scraper: SeleniumScraper, url: str, 
                                         brand_name: str, coll_info: Dict) -> List[Dict]:
         """Scrape a collection using Selenium with pagination"""
-        products = []
+        products = {}  # source_url -> product, in discovery order
         
         try:
             logger.info(f"Navigating to collection: {url}")
-            scraper.get_page(url, wait_time=10)
+            scraper.load_page(url, wait_time=10)
             
-            # For typology pages, wait longer for JavaScript to load products
+            # For typology pages, allow longer for JavaScript to load products
             is_typology = '/typologies/' in url.lower()
             if is_typology:
                 logger.info("Typology page detected - waiting for JavaScript to load products...")
-                scraper.scroll_to_bottom(pause_time=2.0)
-                time.sleep(5)  # Extra wait for JS-rendered content
-                # Scroll again to trigger lazy loading
-                scraper.scroll_to_bottom(pause_time=1.0)
-                time.sleep(3)
-            else:
-                scraper.scroll_to_bottom(pause_time=2.0)
-                time.sleep(3)
+            if not self._wait_for_products(scraper, timeout=15 if is_typology else 10):
+                logger.info("No product elements appeared, reading the page as-is")
+            # Scroll until the height stops growing to trigger lazy loading
+            scraper.scroll_to_bottom(pause_time=1.0)
             
             page_count = 0
             max_pages = 10
+            prefetched_pages = None  # [(url, html)] of pages 2..N when fetched in one in-browser batch
+            last_prefetched_url = None  # Last prefetched page that yielded products
+            last_source_hash = None
             
             while page_count < max_pages:
                 page_count += 1
                 logger.info(f"Scraping page {page_count} of collection: {coll_info.get('category', 'Unknown')}")
                 
-                soup = BeautifulSoup(scraper.driver.page_source, 'html.parser')
-                page_products = self._extract_products_from_page(soup, url, brand_name, coll_info)
+                if prefetched_pages:
+                    page_url, html = prefetched_pages.pop(0)
+                else:
+                    page_url, html = None, scraper.driver.page_source
+                source_hash = hashlib.blake2b(html.encode('utf-8', 'replace'), digest_size=8).digest()
+                if source_hash == last_source_hash:
+                    # Pagination click did not change the DOM - same products as last time, skip the re-parse
+                    logger.debug("Page source unchanged since last page, reusing extracted products")
+                else:
+                    soup = self._soup(html)
+                    page_products = self._extract_products_from_page(soup, url, brand_name, coll_info)
+                    last_source_hash = source_hash
                 
                 logger.info(f"Found {len(page_products)} products on page {page_count}")
                 
+                # Numbered pagination: fetch the remaining pages' HTML directly
+                # while the browser is still on the listing page
+                if page_count == 1 and page_products:
+                    page_urls = self._find_pagination_urls(soup, url, max_pages - 1)
+                    if page_urls:
+                        prefetched_pages = self._fetch_static_pages_in_browser(
+                            scraper, url, page_urls, brand_name, coll_info
+                        )
+                
                 # Deduplicate
-                existing_urls = {p['source_url'] for p in products}
                 new_products = 0
                 for prod in page_products:
-                    if prod['source_url'] not in existing_urls:
-                        # Enrich product with description before adding
-                        self._enrich_product_with_description(prod, scraper)
-                        products.append(prod)
-                        existing_urls.add(prod['source_url'])
+                    if prod['source_url'] not in products:
+                        products[prod['source_url']] = prod
                         new_products += 1
                 
-                logger.info(f"Added {new_products} new products with descriptions (total: {len(products)})")
+                logger.info(f"Added {new_products} new products (total: {len(products)})")
                 
-                # If no products found on this page, stop pagination
-                if len(page_products) == 0:
+                if page_url is not None:
+                    # Prefetched page - the browser is still on the first page
+                    if page_products:
+                        last_prefetched_url = page_url
+                        if prefetched_pages:
+                            continue
+                        # Windowed pagination ("1 2 3 4 5 Next") only links the next few pages
+                        if len(self._find_pagination_urls(soup, url, max_pages)) < page_count:
+                            logger.info("All prefetched pages processed, stopping pagination")
+                            break
+                        logger.info("Prefetched pages used up, continuing with click-through pagination")
+                    else:
+                        # The URL guessed from the pagination links was wrong - click through instead
+                        logger.info(f"Prefetched page {page_url} had no products, switching to click-through pagination")
+                    
+                    prefetched_pages = None
+                    if last_prefetched_url:
+                        # Continue clicking from the last page that worked
+                        self._wait_for_rate_limit(last_prefetched_url)
+                        scraper.load_page(last_prefetched_url, wait_time=10)
+                        self._wait_for_products(scraper)
+                elif not page_products:
                     logger.info("No products found on this page, stopping pagination")
                     break
+                elif prefetched_pages:
+                    continue  # The remaining pages were fetched in one batch
                 
                 # Try to find next page
+                self._wait_for_rate_limit(url)
                 if not self._try_next_page(scraper):
                     logger.info("No next page found, stopping pagination")
                     break
                 
                 time.sleep(1.5)
             
+            # Descriptions are fetched once pagination is done, so the driver stays on the listing
+            self._enrich_products(list(products.values()), scraper)
+            
             logger.info(f"Collection scraping complete. Total products: {len(products)}")
             
         except Exception as e:
             logger.error(f"Error scraping collection with Selenium {url}: {e}")
         
-        return products
+        return list(products.values())
     
-    def _detect_hierarchy_universal(self, soup: BeautifulSoup, base_url: str) -> Dict:
+    def _wait_for_products(self, scraper: SeleniumScraper, timeout: float = 10, min_settle: float = 0.5) -> bool:
+        """
+        Wait until product-like elements are present instead of sleeping a fixed time
+        Returns False if none appeared within the timeout
+        """
+        # The explicit wait polls find_element; with the driver's implicit wait on, every poll
+        # could block for that long too and stretch the timeout well past what was asked for
+        with self._without_implicit_wait(scraper):
+            found = scraper.wait_for_element(By.CSS_SELECTOR, _PRODUCT_READY_SELECTOR, timeout=timeout) is not None
+        time.sleep(min_settle)  # Let the rest of the grid render after the first match
+        return found
+    
+    @contextmanager
+    def _without_implicit_wait(self, scraper: SeleniumScraper):
+        """Switch the driver's implicit wait off for the block so element lookups fail fast, then restore it"""
+        driver = scraper.driver
+        try:
+            previous = driver.timeouts.implicit_wait
+        except Exception:
+            previous = None
+        
+        if previous is None:
+            # Driver cannot report its setting - leave it alone rather than lose it
+            yield
+            return
+        
+        driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            driver.implicitly_wait(previous)
+    
+    def _find_pagination_urls(self, soup: BeautifulSoup, page_url: str, limit: int) -> List[str]:
+        """
+        Build URLs for pages 2..N from numbered pagination links (?page=N, /page/N/)
+        Returns [] when the page has no recognisable pagination of this listing
+        """
+        host = urlparse(page_url).netloc
+        listing_path = _listing_path(page_url)
+        template = None
+        last_page = 1
+        
+        for link in soup.find_all('a', href=_RE_PAGE_NUMBER):
+            href = urljoin(page_url, link['href'])
+            # Only pages of this listing - not /blog/page/4/ or a paged archive elsewhere on the site
+            if urlparse(href).netloc != host or _listing_path(href) != listing_path:
+                continue
+            match = _RE_PAGE_NUMBER.search(href)
+            if match and int(match.group('num')) > last_page:
+                template, last_page = (href, match), int(match.group('num'))
+        
+        if not template:
+            return []
+        
+        href, match = template
+        last_page = min(last_page, limit + 1)
+        return [href[:match.start('num')] + str(n) + href[match.end('num'):] for n in range(2, last_page + 1)]
+    
+    def _fetch_static_pages_in_browser(self, scraper: SeleniumScraper, page_url: str, page_urls: List[str],
+                                       brand_name: str, coll_info: Dict) -> Optional[List[Tuple[str, str]]]:
+        """
+        Fetch same-origin pages' raw HTML with fetch() inside the browser, skipping render and clicks
+        Pages are requested one at a time through the rate limiter, like the rest of the crawl.
+        Returns [(url, html)] for the page_urls fetched. The current page is re-fetched first: if its
+        raw HTML yields no products the listing is rendered by JavaScript, and None is returned so
+        the caller keeps clicking through pages
+        """
+        script = """
+            var done = arguments[arguments.length - 1];
+            fetch(arguments[0], {credentials: 'same-origin'})
+                .then(function (r) { return r.text(); })
+                .then(done, function () { done(null); });
+        """
+        driver = scraper.driver
+        try:
+            previous_timeout = driver.timeouts.script
+        except Exception:
+            previous_timeout = None  # Driver cannot report it - nothing to restore
+        
+        pages = []
+        try:
+            driver.set_script_timeout(30)
+            for url in [page_url] + page_urls:
+                self._wait_for_rate_limit(url)
+                html = driver.execute_async_script(script, url)
+                if not html:
+                    break  # The caller carries on by clicking from the last page fetched
+                
+                if url == page_url:
+                    if not self._extract_products_from_page(self._soup(html), page_url, brand_name, coll_info):
+                        logger.info("Listing is rendered by JavaScript, using click-through pagination")
+                        return None
+                    continue
+                pages.append((url, html))
+        except Exception as e:
+            logger.debug("In-browser page fetch failed for %s: %s", page_url, e)
+        finally:
+            if previous_timeout is not None:
+                driver.set_script_timeout(previous_timeout)
+        
+        if not pages:
+            return None
+        
+        logger.info(f"Fetched {len(pages)} pagination pages through the browser")
+        return pages
+    
+    def _detect_hierarchy_universal(self, soup: BeautifulSoup, base_url: str, html=None) -> Dict:
         """
         Universal hierarchy detection using multiple strategies with smart validation
+        html is the raw page the soup was built from, used for the lxml-based typology pass
         Returns: {collection_name: {'url': ..., 'category': ..., 'subcategory': ...}}
         """
         raw_collections = {}
@@ -470,7 +1008,7 @@ class UniversalBrandScraper:
         # Strategy 0: Special handling for typology-based sites (LAS.it style)
         # Check if we're on a products page with typologies
         if '/products' in base_url.lower() or '/product' in base_url.lower():
-            typology_collections = self._detect_typology_categories(soup, base_url)
+            typology_collections = self._detect_typology_categories(html if html is not None else str(soup), base_url)
             if typology_collections:
                 logger.info(f"Found {len(typology_collections)} typology categories (LAS.it style)")
                 raw_collections.update(typology_collections)
@@ -492,20 +1030,9 @@ class UniversalBrandScraper:
         nav_collections = self._detect_from_navigation(soup, base_url)
         raw_collections.update(nav_collections)
         
-        # Strategy 2: Category grid/list on homepage
+        # Strategies 2-3: Category grid, then footer links (one pass over the page)
         if not raw_collections:
-            grid_collections = self._detect_from_category_grid(soup, base_url)
-            raw_collections.update(grid_collections)
-        
-        # Strategy 3: Footer links
-        if not raw_collections:
-            footer_collections = self._detect_from_footer(soup, base_url)
-            raw_collections.update(footer_collections)
-        
-        # Strategy 4: Sitemap or all products link
-        if not raw_collections:
-            sitemap_collections = self._detect_from_sitemap(soup, base_url)
-            raw_collections.update(sitemap_collections)
+            raw_collections.update(self._detect_from_page_fallbacks(soup, base_url))
         
         logger.info(f"Detected {len(raw_collections)} raw collections")
         
@@ -525,15 +1052,21 @@ class UniversalBrandScraper:
         logger.info(f"Final collections count: {len(collections)}")
         return collections
     
-    def _detect_typology_categories(self, soup: BeautifulSoup, base_url: str) -> Dict:
+    def _detect_typology_categories(self, html, base_url: str) -> Dict:
         """
         Detect typology categories for LAS.it and similar sites
         Looks for /typologies/ links and extracts category names
+        Runs on an lxml tree so the parent/heading lookups are compiled XPath
         """
         collections = {}
+        seen_urls = set()
+        
+        doc = self._lxml_document(html)
+        if doc is None:
+            return collections
         
         # Find all typology links
-        typology_links = soup.find_all('a', href=re.compile(r'/typologies/', re.I))
+        typology_links = _XP_TYPOLOGY(doc)
         logger.info(f"Found {len(typology_links)} typology links")
         
         for link in typology_links:
@@ -542,18 +1075,20 @@ class UniversalBrandScraper:
                 continue
             
             full_url = urljoin(base_url, href)
+            if full_url in seen_urls:
+                continue  # Same typology linked again (e.g. image + "Find out more")
             
             # Get category name from link text or nearby heading
-            text = link.get_text(strip=True)
+            text = _element_text(link)
             
             # Skip generic links
-            if text.lower() in ['find out more', 'read more', 'view', 'see more', '']:
+            if text.lower() in _GENERIC_LINK_TEXTS:
                 # Try to get from parent/section heading
-                parent = link.find_parent(['div', 'article', 'section', 'li'])
+                parent = _XP_PARENT_CONTAINER(link)
                 if parent:
-                    heading = parent.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+                    heading = _XP_HEADING(parent[0])
                     if heading:
-                        text = heading.get_text(strip=True)
+                        text = _element_text(heading[0])
             
             # If still no text, extract from URL
             if not text or len(text) < 2:
@@ -573,259 +1108,157 @@ class UniversalBrandScraper:
                         'category': text,
                         'subcategory': None
                     }
-                    logger.info(f"  ✓ Found typology: {text} -> {full_url}")
+                    seen_urls.add(full_url)
+                    logger.info("  ✓ Found typology: %s -> %s", text, full_url)
         
         return collections
     
+    def _lxml_document(self, html):
+        """Parse raw HTML (str or bytes) into an lxml document, or None if there is nothing to parse"""
+        try:
+            return lxml.html.document_fromstring(html)
+        except ValueError:
+            # str input that still carries an XML encoding declaration
+            return lxml.html.document_fromstring(html.encode('utf-8'))
+        except etree.ParserError:
+            return None
+    
     def _detect_from_navigation(self, soup: BeautifulSoup, base_url: str) -> Dict:
         """Detect categories from navigation menu with enhanced submenu detection"""
         collections = {}
+        seen_urls = set()  # URLs already registered as collections
         parent_has_children = set()  # Track which parents have subcategories
         
-        # Find navigation
-        nav_selectors = [
-            ('nav', {}),
-            ('div', {'class': re.compile(r'(nav|menu|header)', re.I)}),
-            ('ul', {'class': re.compile(r'(nav|menu)', re.I)})
-        ]
-        
-        for tag, attrs in nav_selectors:
-            navs = soup.find_all(tag, attrs)
-            for nav in navs:
-                # Find all links
-                links = nav.find_all('a', href=True)
-                for link in links:
-                    href = link.get('href', '').strip()
-                    text = link.get_text(strip=True)
+        # All links inside navigation containers, in one selector pass (document order, no repeats)
+        for link in _NAV_LINK_SELECTOR.select(soup):
+            href = link.get('href', '').strip()
+            text = link.get_text(strip=True)
+            
+            # Filter for category-like links
+            if self._is_category_link(href, text):
+                full_url = urljoin(base_url, href)
+                clean_name = self._clean_category_name(text)
+                
+                if clean_name and full_url not in seen_urls:
+                    # Check for subcategories - look for multiple submenu patterns
+                    parent = link.find_parent(['li', 'div'])
+                    submenu = None
+                    
+                    if parent:
+                        # Try multiple submenu selectors
+                        submenu = (
+                            parent.find(['ul', 'div'], class_=_RE_SUB) or
+                            parent.find('ul') or  # Generic ul as fallback
+                            parent.find('div', class_=_RE_MENU)
+                        )
                     
-                    # Filter for category-like links
-                    if self._is_category_link(href, text):
-                        full_url = urljoin(base_url, href)
-                        clean_name = self._clean_category_name(text)
+                    if submenu:
+                        # Has subcategories - mark parent and add children
+                        parent_has_children.add(clean_name)
+                        sublinks = submenu.find_all('a', href=True)
                         
-                        if clean_name and full_url not in [c['url'] for c in collections.values()]:
-                            # Check for subcategories - look for multiple submenu patterns
-                            parent = link.find_parent(['li', 'div'])
-                            submenu = None
+                        for sublink in sublinks:
+                            subhref = sublink.get('href', '').strip()
+                            subtext = sublink.get_text(strip=True)
                             
-                            if parent:
-                                # Try multiple submenu selectors
-                                submenu = (
-                                    parent.find(['ul', 'div'], class_=re.compile(r'(sub|dropdown|child)', re.I)) or
-                                    parent.find('ul') or  # Generic ul as fallback
-                                    parent.find('div', class_=re.compile(r'menu', re.I))
-                                )
-                            
-                            if submenu:
-                                # Has subcategories - mark parent and add children
-                                parent_has_children.add(clean_name)
-                                sublinks = submenu.find_all('a', href=True)
-                                
-                                for sublink in sublinks:
-                                    subhref = sublink.get('href', '').strip()
-                                    subtext = sublink.get_text(strip=True)
-                                    
-                                    if self._is_category_link(subhref, subtext):
-                                        sub_full_url = urljoin(base_url, subhref)
-                                        sub_clean_name = self._clean_category_name(subtext)
-                                        
-                                        if sub_clean_name and sub_clean_name != clean_name:
-                                            coll_key = f"{clean_name} > {sub_clean_name}"
-                                            collections[coll_key] = {
-                                                'url': sub_full_url,
-                                                'category': clean_name,
-                                                'subcategory': sub_clean_name
-                                            }
+                            if self._is_category_link(subhref, subtext):
+                                sub_full_url = urljoin(base_url, subhref)
+                                sub_clean_name = self._clean_category_name(subtext)
                                 
-                                # Also add parent category (will be filtered by tree builder if needed)
-                                collections[clean_name] = {
-                                    'url': full_url,
-                                    'category': clean_name,
-                                    'subcategory': None
-                                }
-                            else:
-                                # Top-level category without subcategories
-                                collections[clean_name] = {
-                                    'url': full_url,
-                                    'category': clean_name,
-                                    'subcategory': None
-                                }
+                                if sub_clean_name and sub_clean_name != clean_name:
+                                    coll_key = f"{clean_name} > {sub_clean_name}"
+                                    collections[coll_key] = {
+                                        'url': sub_full_url,
+                                        'category': clean_name,
+                                        'subcategory': sub_clean_name
+                                    }
+                                    seen_urls.add(sub_full_url)
+                        
+                        # Also add parent category (will be filtered by tree builder if needed)
+                        collections[clean_name] = {
+                            'url': full_url,
+                            'category': clean_name,
+                            'subcategory': None
+                        }
+                    else:
+                        # Top-level category without subcategories
+                        collections[clean_name] = {
+                            'url': full_url,
+                            'category': clean_name,
+                            'subcategory': None
+                        }
+                    seen_urls.add(full_url)
         
         logger.info(f"Navigation detection: {len(collections)} total, {len(parent_has_children)} parents with children")
         return collections
     
-    def _detect_typology_categories(self, soup: BeautifulSoup, base_url: str) -> Dict:
+    def _detect_from_page_fallbacks(self, soup: BeautifulSoup, base_url: str) -> Dict:
         """
-        Detect typology categories for LAS.it and similar sites
-        Looks for /typologies/ links and extracts category names
+        Detect categories from a category grid/list, falling back to footer links
+        Both candidate sets are gathered in a single walk over the page
         """
-        collections = {}
-        
-        # Find all typology links
-        typology_links = soup.find_all('a', href=re.compile(r'/typologies/', re.I))
-        logger.info(f"Found {len(typology_links)} typology links")
-        
-        for link in typology_links:
-            href = link.get('href', '').strip()
-            if not href:
+        grid_divs = []
+        grid_items = []
+        footer = None
+        footer_div = None
+        
+        for elem in soup.find_all(['div', 'li', 'footer']):
+            if elem.name == 'footer':
+                if footer is None:
+                    footer = elem
                 continue
-            
-            full_url = urljoin(base_url, href)
-            
-            # Get category name from link text or nearby heading
-            text = link.get_text(strip=True)
-            
-            # Skip generic links
-            if text.lower() in ['find out more', 'read more', 'view', 'see more', '']:
-                # Try to get from parent/section heading
-                parent = link.find_parent(['div', 'article', 'section', 'li'])
-                if parent:
-                    heading = parent.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                    if heading:
-                        text = heading.get_text(strip=True)
-            
-            # If still no text, extract from URL
-            if not text or len(text) < 2:
-                url_parts = [p for p in href.split('/') if p]
-                if 'typologies' in url_parts:
-                    typology_index = url_parts.index('typologies')
-                    if typology_index + 1 < len(url_parts):
-                        category_slug = url_parts[typology_index + 1]
-                        text = category_slug.replace('-', ' ').replace('_', ' ').title()
-            
-            if text and len(text) >= 2:
-                # Clean up text
-                text = self._clean_category_name(text)
-                if text and text not in collections:
-                    collections[text] = {
-                        'url': full_url,
-                        'category': text,
-                        'subcategory': None
-                    }
-                    logger.info(f"  ✓ Found typology: {text} -> {full_url}")
-        
-        return collections
-    
-    def _detect_from_category_grid(self, soup: BeautifulSoup, base_url: str) -> Dict:
-        """Detect categories from grid/list on homepage"""
-        collections = {}
-        
-        # Look for category grids
-        grid_selectors = [
-            ('div', {'class': re.compile(r'(category|collection|product-cat)', re.I)}),
-            ('li', {'class': re.compile(r'(category|collection)', re.I)})
-        ]
-        
-        for tag, attrs in grid_selectors:
-            items = soup.find_all(tag, attrs)
-            for item in items:
-                link = item.find('a', href=True)
-                if link:
-                    href = link.get('href', '').strip()
-                    text = link.get_text(strip=True) or item.get_text(strip=True)
-                    
-                    if self._is_category_link(href, text):
-                        full_url = urljoin(base_url, href)
-                        clean_name = self._clean_category_name(text)
-                        
-                        if clean_name:
-                            collections[clean_name] = {
-                                'url': full_url,
-                                'category': clean_name,
-                                'subcategory': None
-                            }
-        
-        return collections
-
-    
-    def _detect_from_footer(self, soup: BeautifulSoup, base_url: str) -> Dict:
-        """Detect categories from footer links"""
-        collections = {}
-        
-        footer = soup.find('footer') or soup.find('div', class_=re.compile(r'footer', re.I))
+            classes = ' '.join(elem.get('class') or ())
+            if not classes:
+                continue
+            if elem.name == 'div':
+                if _RE_GRID_DIV.search(classes):
+                    grid_divs.append(elem)
+                if footer_div is None and _RE_FOOTER.search(classes):
+                    footer_div = elem
+            elif _RE_GRID_ITEM.search(classes):
+                grid_items.append(elem)
+        
+        # Category grid: div matches take precedence over list items, as before
+        links = []
+        for item in grid_divs + grid_items:
+            link = item.find('a', href=True)
+            if link:
+                links.append((link.get('href', '').strip(), link.get_text(strip=True) or item.get_text(strip=True)))
+        
+        collections = self._top_level_collections(links, base_url)
+        if collections:
+            return collections
+        
+        # Footer links
+        footer = footer or footer_div
         if footer:
-            links = footer.find_all('a', href=True)
-            for link in links:
-                href = link.get('href', '').strip()
-                text = link.get_text(strip=True)
-                
-                if self._is_category_link(href, text):
-                    full_url = urljoin(base_url, href)
-                    clean_name = self._clean_category_name(text)
-                    
-                    if clean_name:
-                        collections[clean_name] = {
-                            'url': full_url,
-                            'category': clean_name,
-                            'subcategory': None
-                        }
+            links = [(link.get('href', '').strip(), link.get_text(strip=True))
+                     for link in footer.find_all('a', href=True)]
+            collections = self._top_level_collections(links, base_url)
         
         return collections
     
-    def _detect_from_sitemap(self, soup: BeautifulSoup, base_url: str) -> Dict:
-        """Try to find sitemap or all products page"""
+    def _top_level_collections(self, links: List[Tuple[str, str]], base_url: str) -> Dict:
+        """Build top-level collections from (href, text) pairs that look like categories"""
         collections = {}
-        
-        # Look for sitemap links
-        sitemap_link = soup.find('a', href=re.compile(r'(sitemap|all-products|products)', re.I))
-        if sitemap_link:
-            # This would require additional scraping
-            pass
-        
+        for href, text in links:
+            if self._is_category_link(href, text):
+                clean_name = self._clean_category_name(text)
+                if clean_name:
+                    collections[clean_name] = {
+                        'url': urljoin(base_url, href),
+                        'category': clean_name,
+                        'subcategory': None
+                    }
         return collections
     
     def _is_category_link(self, href: str, text: str) -> bool:
         """Determine if a link is likely a category"""
-        if not href or not text:
-            return False
-        
-        # Exclude common non-category links
-        exclude_patterns = [
-            r'#', r'javascript:', r'mailto:', r'tel:',
-            r'(login|register|account|cart|checkout|contact|about|faq)',
-            r'(facebook|twitter|instagram|linkedin|youtube)',
-            r'\.(pdf|jpg|png|gif|zip)'
-        ]
-        
-        for pattern in exclude_patterns:
-            if re.search(pattern, href, re.I) or re.search(pattern, text, re.I):
-                return False
-        
-        # Include category-like patterns
-        include_patterns = [
-            r'(category|collection|product|shop|furniture)',
-            r'(chair|desk|table|sofa|storage|office)'
-        ]
-        
-        for pattern in include_patterns:
-            if re.search(pattern, href, re.I):
-                return True
-        # Check text length (categories usually have short names)
-        return 2 <= len(text) <= 50
+        return _is_category_link_cached(href, text)
 
     def _clean_category_name(self, name: str) -> str:
         """Clean up category name (e.g. 'Open submenu (Chairs)' -> 'Chairs')"""
-        if not name:
-            return ""
-        
-        # Normalize whitespace
-        name = " ".join(name.split())
-        
-        # Remove "Open/Close submenu" prefixes/suffixes
-        # Matches: "Open submenu", "Close submenu", "Open submenu (Chairs)", "Close submenu [Chairs]"
-        name = re.sub(r'^(Open|Close)\s+submenu\s*[\(\[]?', '', name, flags=re.I)
-        name = re.sub(r'[\)\]]$', '', name)
-        
-        # Remove "Toggle" prefix
-        name = re.sub(r'^Toggle\s+', '', name, flags=re.I)
-        
-        # Remove counts (e.g. "Chairs (10)")
-        name = re.sub(r'\s*\(\d+\)$', '', name)
-        
-        # Remove common navigation artifacts
-        name = re.sub(r'^(View|See|Show|All)\s+', '', name, flags=re.I)
-        
-        return name.strip()
+        return _clean_category_name_cached(name)
     
     def _extract_product_features(self, soup: BeautifulSoup) -> List[str]:
         """Extract product features/specifications from product page"""
@@ -833,7 +1266,7 @@ class UniversalBrandScraper:
         
         try:
             # Look for feature lists
-            feature_lists = soup.find_all(['ul', 'ol'], class_=re.compile(r'(feature|spec|benefit|specification)', re.I))
+            feature_lists = soup.find_all(['ul', 'ol'], class_=_RE_FEATURE_LIST)
             
             for feature_list in feature_lists[:2]:  # Limit to 2 lists
                 for item in feature_list.find_all('li')[:10]:  # Max 10 features per list
@@ -842,7 +1275,7 @@ class UniversalBrandScraper:
                         features.append(text)
             
             # Also look for specification tables
-            spec_tables = soup.find_all('table', class_=re.compile(r'(spec|feature|detail)', re.I))
+            spec_tables = soup.find_all('table', class_=_RE_SPEC_TABLE)
             for table in spec_tables[:1]:  # Limit to 1 table
                 rows = table.find_all('tr')[:10]  # Max 10 rows
                 for row in rows:
@@ -859,29 +1292,47 @@ class UniversalBrandScraper:
         
         return features[:15]  # Limit total features to 15
     
-    def _try_next_page(self, scraper: SeleniumScraper) -> bool:
-        """Try to navigate to next page"""
-        next_selectors = [
-            "a[rel='next']",
-            "a.next",
-            "button.next",
-            ".pagination a:last-child",
-            "a:contains('Next')",
-            "button:contains('Load More')"
-        ]
-        
-        for selector in next_selectors:
-            try:
-                elements = scraper.driver.find_elements("css selector", selector)
-                for elem in elements:
-                    if elem.is_displayed() and elem.is_enabled():
-                        elem.click()
-                        time.sleep(2)
-                        return True
-            except:
-                continue
+    def _enrich_products(self, products: List[Dict], scraper: SeleniumScraper):
+        """
+        Fill in missing product descriptions in one batch
+        Detail pages are fetched over HTTP in parallel; only pages that failed to fetch
+        or look JavaScript-rendered are rendered with Selenium afterwards
+        """
+        pending = [p for p in products if p.get('source_url') and not p.get('description')]
+        if not pending:
+            return
+        
+        logger.info(f"Fetching descriptions for {len(pending)} products")
+        with ThreadPoolExecutor(max_workers=self.config['max_workers']) as executor:
+            descriptions = list(executor.map(self._fetch_static_description,
+                                             [p['source_url'] for p in pending]))
+        
+        rendered = 0
+        for product, description in zip(pending, descriptions):
+            if description is not None:
+                product['description'] = description
+            else:
+                self._enrich_product_with_description(product, scraper)
+                rendered += 1
         
-        return False
+        if rendered:
+            logger.info(f"Rendered {rendered} detail pages with Selenium for descriptions")
+    
+    def _fetch_static_description(self, url: str) -> Optional[str]:
+        """
+        Fetch a product page without a browser and extract its description
+        Returns '' for a complete page with no description, None when the page needs rendering
+        """
+        try:
+            html = self._get_html(url, detail_page=True)
+            description = self._extract_description(self._soup(html))
+            if description:
+                return description
+            # A server-rendered page without a description will not grow one in a browser
+            return None if self._looks_javascript_rendered(html) else ''
+        except Exception as e:
+            logger.debug("Static description fetch failed for %s: %s", url, e)
+            return None
     
     def _enrich_product_with_description(self, product: Dict, scraper: SeleniumScraper):
         """Enrich a product with description by visiting its detail page"""
@@ -889,70 +1340,56 @@ class UniversalBrandScraper:
             if not product.get('source_url'):
                 return
             
-            scraper.get_page(product['source_url'], wait_time=3)
-            soup = BeautifulSoup(scraper.driver.page_source, 'html.parser')
-            
-            # Extract description using multiple strategies
-            description = None
-            
-            # Strategy 1: Common description selectors
-            desc_selectors = [
-                'div.entry-content',
-                'div.product-content',
-                'div.content p',
-                'article p',
-                'section.product-description',
-                'div.description',
-                'div.woocommerce-product-details__short-description',
-                'div.product-short-description',
-                'div[itemprop="description"]',
-                'div#tab-description',
-                'div.woocommerce-Tabs-panel--description'
-            ]
-            
-            for selector in desc_selectors:
-                desc_elem = soup.select_one(selector)
-                if desc_elem:
-                    # Remove script, style, nav, header, footer
-                    for tag in desc_elem.find_all(['script', 'style', 'nav', 'header', 'footer', 'button', 'a']):
-                        tag.decompose()
-                    
-                    desc_text = desc_elem.get_text(separator=' ', strip=True)
-                    if desc_text and len(desc_text) > 30:  # Minimum description length
-                        description = desc_text
-                        break
-            
-            # Strategy 2: Try to find main content area
-            if not description:
-                main_content = soup.find('main') or soup.find('article') or soup.find('div', class_=re.compile(r'content|main', re.I))
-                if main_content:
-                    # Get all paragraphs
-                    paragraphs = main_content.find_all('p')
-                    if paragraphs:
-                        desc_text = ' '.join(p.get_text(strip=True) for p in paragraphs[:5])
-                        if desc_text and len(desc_text) > 30:
-                            description = desc_text
-            
-            # Clean up description
-            if description:
-                # Remove extra whitespace
-                description = re.sub(r'\s+', ' ', description).strip()
-                # Remove common unwanted text
-                unwanted = ['add to cart', 'add to wishlist', 'share:', 'sku:', 'categories:', 'tags:', 'read more', 'view all']
-                for unwanted_text in unwanted:
-                    description = re.sub(unwanted_text, '', description, flags=re.IGNORECASE)
-                description = description.strip()
-                
-                # Limit description length
-                if len(description) > 1000:
-                    description = description[:1000] + '...'
-            
-            product['description'] = description or ''
+            html = self._get_rendered_html(scraper, product['source_url'], wait_time=3)
+            product['description'] = self._extract_description(self._soup(html)) or ''
             
         except Exception as e:
-            logger.debug(f"Could not fetch description for {product.get('source_url', 'unknown')}: {e}")
+            logger.debug("Could not fetch description for %s: %s", product.get('source_url', 'unknown'), e)
             product['description'] = ''
     
+    def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
+        """Extract a cleaned product description from a detail page"""
+        description = None
+        
+        # Strategy 1: Common description selectors
+        for selector in _DESCRIPTION_SELECTORS:
+            desc_elem = selector.select_one(soup)
+            if desc_elem:
+                # Remove script, style, nav, header, footer
+                for tag in desc_elem.find_all(['script', 'style', 'nav', 'header', 'footer', 'button', 'a']):
+                    tag.decompose()
+                
+                desc_text = desc_elem.get_text(separator=' ', strip=True)
+                if desc_text and len(desc_text) > 30:  # Minimum description length
+                    description = desc_text
+                    break
+        
+        # Strategy 2: Try to find main content area
+        if not description:
+            main_content = soup.find('main') or soup.find('article') or soup.find('div', class_=_RE_MAIN_CONTENT)
+            if main_content:
+                # Get all paragraphs
+                paragraphs = main_content.find_all('p')
+                if paragraphs:
+                    desc_text = ' '.join(p.get_text(strip=True) for p in paragraphs[:5])
+                    if desc_text and len(desc_text) > 30:
+                        description = desc_text
+        
+        return self._clean_description(description) if description else description
+    
+    def _clean_description(self, description: str) -> str:
+        """Collapse whitespace, strip shop boilerplate and cap the length of a description"""
+        # Remove extra whitespace
+        description = ' '.join(description.split())
+        # Remove common unwanted text in one pass
+        description = _RE_UNWANTED_DESC.sub('', description).strip()
+        
+        # Limit description length
+        if len(description) > 1000:
+            description = description[:1000] + '...'
+        
+        return description
+    
     def fetch_product_details(self, product_url: str, use_selenium: bool = False) -> Dict:
         """
         Fetch detailed product information from a product page
@@ -969,23 +1406,16 @@ class UniversalBrandScraper:
             if use_selenium and SELENIUM_AVAILABLE:
                 scraper = SeleniumScraper(headless=True, timeout=30)
                 try:
-                    scraper.get_page(product_url, wait_time=5)
-                    soup = BeautifulSoup(scraper.driver.page_source, 'html.parser')
+                    scraper.load_page(product_url, wait_time=5)
+                    soup = self._soup(scraper.driver.page_source)
                 finally:
                     scraper.close()
             else:
-                response = requests.get(product_url, headers=self.headers, timeout=10)
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = self._soup(self._get_html(product_url, detail_page=True))
             
             # Extract description
-            desc_selectors = [
-                soup.find('div', class_=re.compile(r'product.*description', re.I)),
-                soup.find('div', class_=re.compile(r'description', re.I)),
-                soup.find('div', {'id': re.compile(r'description', re.I)}),
-                soup.find('div', class_=re.compile(r'product.*content', re.I))
-            ]
-            
-            for desc_elem in desc_selectors:
+            for tag, attrs in _DETAIL_DESCRIPTION_LOOKUPS:
+                desc_elem = soup.find(tag, attrs)
                 if desc_elem:
                     # Remove script and style tags
                     for tag in desc_elem.find_all(['script', 'style']):
@@ -1002,13 +1432,8 @@ class UniversalBrandScraper:
                 details['features'] = features
             
             # Extract main image
-            img_selectors = [
-                soup.find('img', class_=re.compile(r'product.*image', re.I)),
-                soup.find('div', class_=re.compile(r'product.*gallery', re.I)),
-                soup.find('figure', class_=re.compile(r'product', re.I))
-            ]
-            
-            for img_container in img_selectors:
+            for tag, attrs in _DETAIL_IMAGE_LOOKUPS:
+                img_container = soup.find(tag, attrs)
                 if img_container:
                     img = img_container if img_container.name == 'img' else img_container.find('img')
                     if img:
@@ -1020,13 +1445,8 @@ class UniversalBrandScraper:
             # Features already extracted above via _extract_product_features
             
             # Extract price
-            price_selectors = [
-                soup.find('span', class_=re.compile(r'price', re.I)),
-                soup.find('div', class_=re.compile(r'price', re.I)),
-                soup.find('p', class_=re.compile(r'price', re.I))
-            ]
-            
-            for price_elem in price_selectors:
+            for tag, attrs in _DETAIL_PRICE_LOOKUPS:
+                price_elem = soup.find(tag, attrs)
                 if price_elem:
                     price_text = price_elem.get_text(strip=True)
                     if price_text and any(char.isdigit() for char in price_text):
@@ -1038,6 +1458,20 @@ class UniversalBrandScraper:
         
         return details
     
+    def fetch_product_details_batch(self, product_urls: List[str], use_selenium: bool = False) -> Dict[str, Dict]:
+        """
+        Fetch details for many product pages concurrently (pages are network-bound)
+        Returns {product_url: details} in the same shape as fetch_product_details
+        """
+        unique_urls = list(dict.fromkeys(url for url in product_urls if url))
+        if not unique_urls:
+            return {}
+        
+        logger.info(f"Fetching details for {len(unique_urls)} products with {self.config['max_workers']} workers")
+        with ThreadPoolExecutor(max_workers=self.config['max_workers']) as executor:
+            results = executor.map(lambda url: self.fetch_product_details(url, use_selenium), unique_urls)
+            return dict(zip(unique_urls, results))
+    
     def _discover_subcategories_from_products(self, products: List[Dict], scraper) -> Dict[str, str]:
         """
         Visit a few products to discover subcategories via breadcrumbs
@@ -1051,8 +1485,9 @@ class UniversalBrandScraper:
             
             try:
                 logger.info(f"Checking product for subcategories: {url}")
-                scraper.get_page(url, wait_time=5)
-                soup = BeautifulSoup(scraper.driver.page_source, 'html.parser')
+                html = self._get_rendered_html(scraper, url, wait_time=5)
+                # Only the breadcrumbs are read, so skip building the rest of the tree
+                soup = self._soup(html, parse_only=_BREADCRUMB_STRAINER)
                 breadcrumbs = self.extract_breadcrumb_links(soup)
                 
                 # Look for parent category in breadcrumbs and take the next item
@@ -1082,22 +1517,14 @@ class UniversalBrandScraper:
     def extract_breadcrumb_links(self, soup: BeautifulSoup) -> List[Tuple[str, str]]:
         """Extract breadcrumb links (name, url) from product page"""
         
-        # Common breadcrumb selectors
-        selectors = [
-            (['nav', 'div', 'ul', 'ol'], {'class': re.compile(r'(breadcrumb|bread-crumb|path)', re.I)}),
-            ('div', {'id': re.compile(r'(breadcrumb)', re.I)}),
-        ]
-        
-        for tag, attrs in selectors:
-            # Use find_all to get all potential containers
-            containers = soup.find_all(tag, attrs)
-            for container in containers:
+        for selector in _BREADCRUMB_CONTAINER_SELECTORS:
+            # All potential containers, in document order
+            for container in selector.select(soup):
                 breadcrumbs = []
-                links = container.find_all('a', href=True)
-                for link in links:
+                for link in container.find_all('a', href=True):
                     text = link.get_text(strip=True)
                     href = link.get('href')
-                    if text and href and text not in ['Home', '>', '/', '»']:
+                    if text and href and text not in _BREADCRUMB_SKIP_TEXT:
                         breadcrumbs.append((text, href))
                 
                 # If we found a container with links, return it
@@ -1106,46 +1533,47 @@ class UniversalBrandScraper:
         
         return []
 
-    def _empty_result(self, brand_name: str) -> Dict:
-        """Return empty result structure"""
+    def _new_result(self, brand_name: str, source: str, total_collections: int = 0) -> Dict:
+        """Return the result skeleton shared by every scrape path"""
         return {
             'brand': brand_name,
-            'source': 'Brand Website',
+            'source': source,
             'scraped_at': datetime.now().isoformat(),
             'total_products': 0,
-            'total_collections': 0,
+            'total_collections': total_collections,
             'collections': {},
             'all_products': []
         }
+    
+    def _collection_entry(self, coll_info: Dict, products: List[Dict]) -> Dict:
+        """Build the per-collection result entry"""
+        return {
+            'url': coll_info['url'],
+            'category': coll_info.get('category'),
+            'subcategory': coll_info.get('subcategory'),
+            'product_count': len(products),
+            'products': products
+        }
+    
+    def _empty_result(self, brand_name: str) -> Dict:
+        """Return empty result structure"""
+        return self._new_result(brand_name, 'Brand Website')
 
     def _extract_products_from_page(self, soup: BeautifulSoup, page_url: str, 
                                    brand_name: str, coll_info: Dict) -> List[Dict]:
         """Extract products from a page using universal selectors"""
         products = []
         
-        # Multiple container patterns - WooCommerce first, then generic
-        container_selectors = [
-            # WooCommerce specific (li or div)
-            ('li', {'class': re.compile(r'product\s|type-product', re.I)}),
-            ('div', {'class': re.compile(r'product\s|type-product', re.I)}),
-            ('div', {'class': re.compile(r'product-grid-item', re.I)}),
-            ('div', {'class': re.compile(r'product-item', re.I)}),
-            
-            # Generic product containers
-            ('div', {'class': re.compile(r'product-card', re.I)}),
-            ('article', {'class': re.compile(r'product', re.I)}),
-            ('div', {'class': re.compile(r'(item|card).*product', re.I)}),
-            
-            # Fallback
-            ('div', {'class': re.compile(r'(item|card)', re.I)})
-        ]
-        
         containers = []
-        for tag, attrs in container_selectors:
-            found = soup.find_all(tag, attrs, limit=200)
+        seen_ids = set()  # Tags compare by content, so track the nodes themselves
+        for selector in _PRODUCT_CONTAINER_TIERS:
+            found = selector.select(soup, limit=200)
             if found:
-                logger.debug(f"Found {len(found)} containers with {tag} {attrs}")
-                containers.extend(found)
+                logger.debug("Found %d containers with %s", len(found), selector.pattern)
+                for node in found:
+                    if id(node) not in seen_ids:
+                        seen_ids.add(id(node))
+                        containers.append(node)
                 if len(containers) > 20:  # Found enough
                     break
         
@@ -1163,36 +1591,32 @@ class UniversalBrandScraper:
                                        brand_name: str, coll_info: Dict) -> Optional[Dict]:
         """Extract product info from a container element with enhanced filtering"""
         try:
+            fields = self._scan_container(container)
+            
             # Find link first (most reliable)
-            link_elem = container.find('a', href=True)
+            link_elem = fields.get('link')
             product_url = urljoin(base_url, link_elem['href']) if link_elem else None
             
             # Skip if URL looks like a category
             if product_url:
                 # Skip category URLs
-                if any(pattern in product_url.lower() for pattern in ['/product-category/', '/category/', '/typologies/']):
+                if _RE_CATEGORY_URL.search(product_url):
                     # But allow if it's a product within typology (deeper path)
-                    if '/typologies/' in product_url.lower():
-                        path_parts = [p for p in product_url.split('/') if p]
-                        typology_index = [i for i, p in enumerate(path_parts) if 'typologies' in p.lower()]
-                        if typology_index and len(path_parts) <= typology_index[0] + 2:
-                            # This is just the typology category page, not a product
-                            return None
-                    else:
+                    typology_match = _RE_TYPOLOGY_DEPTH.search(product_url)
+                    if not typology_match or not typology_match.group(2):
+                        # Plain category page, or just the typology category page
                         return None
             
             # Find title - try multiple strategies
             title = None
             
             # Strategy 1: Look for title/name/product class
-            title_elem = container.find(['h2', 'h3', 'h4', 'a', 'span', 'div'], class_=re.compile(r'(title|name|product.*name|woocommerce-loop-product__title)', re.I))
-            if title_elem:
-                title = title_elem.get_text(strip=True)
+            title = fields.get('title_text')
             
             # Strategy 2: If no title found, try any heading in the container
             if not title:
-                for tag in ['h2', 'h3', 'h4', 'h5']:
-                    heading = container.find(tag)
+                for tag in _TILE_HEADING_TAGS:
+                    heading = fields.get(tag)
                     if heading:
                         title = heading.get_text(strip=True)
                         break
@@ -1213,15 +1637,7 @@ class UniversalBrandScraper:
                 return None
                 
             # Check for navigation keywords
-            nav_keywords = [
-                'open submenu', 'close submenu', 'toggle', 'menu', 'back', 
-                'search', 'cart', 'account', 'login', 'register', 'checkout',
-                'view all', 'read more', 'select options', 'add to cart',
-                'filter', 'sort', 'previous', 'next'
-            ]
-            
-            title_lower = title.lower()
-            if any(keyword in title_lower for keyword in nav_keywords):
+            if _RE_NAV_KEYWORDS.search(title):
                 return None
                 
             # Check for very short titles or just numbers
@@ -1229,7 +1645,7 @@ class UniversalBrandScraper:
                 return None
             
             # Find image
-            img = container.find('img')
+            img = fields.get('img')
             image_url = None
             if img:
                 image_url = img.get('src') or img.get('data-src') or img.get('data-lazy-src') or img.get('data-original')
@@ -1237,9 +1653,15 @@ class UniversalBrandScraper:
                     image_url = urljoin(base_url, image_url)
             
             # Find price
-            price_elem = container.find(['span', 'div'], class_=re.compile(r'price', re.I))
+            price_elem = fields.get('price')
             price = self._parse_price(price_elem.get_text(strip=True)) if price_elem else None
             
+            # Listing tiles often carry a short description; keep it so the detail page can be skipped
+            desc_elem = self._tile_description(fields)
+            description = self._clean_description(desc_elem.get_text(' ', strip=True)) if desc_elem else ''
+            if len(description) <= 30:
+                description = ''
+            
             # Only return if we have at least a title or a product URL
             if title or product_url:
                 product = {
@@ -1251,7 +1673,7 @@ class UniversalBrandScraper:
                     'collection': coll_info.get('collection', 'General'),
                     'category': coll_info.get('category', 'General'),
                     'subcategory': coll_info.get('subcategory', 'General'),
-                    'description': ''  # Will be populated if fetch_product_details is called
+                    'description': description  # Otherwise populated by enrichment / fetch_product_details
                 }
                 return product
             
@@ -1261,130 +1683,269 @@ class UniversalBrandScraper:
             # logger.debug(f"Error extracting product from container: {e}")
             return None
 
+    def _scan_container(self, container: Tag) -> Dict[str, Any]:
+        """
+        Collect a product tile's candidate elements in one walk over its descendants
+        Each key holds the first match in document order, as container.find() would return
+        """
+        fields = {}
+        for node in container.descendants:
+            name = node.name
+            if name is None:
+                continue  # Text and comments
+            
+            if name == 'a' and 'link' not in fields and node.get('href') is not None:
+                fields['link'] = node
+            if name in _TILE_HEADING_TAGS and name not in fields:
+                fields[name] = node
+            if name == 'img' and 'img' not in fields:
+                fields['img'] = node
+            
+            classes = node.get('class')
+            if not classes:
+                continue
+            classes = ' '.join(classes)
+            if name in _TITLE_TAGS and 'title' not in fields and _RE_TITLE_CLASS.search(classes):
+                fields['title'] = node
+                fields['title_text'] = node.get_text(strip=True)
+            if name in _PRICE_TAGS and 'price' not in fields and _RE_PRICE_CLASS.search(classes):
+                fields['price'] = node
+            if name in _TILE_DESCRIPTION_TAGS and _RE_TILE_DESCRIPTION.search(classes):
+                fields.setdefault('descriptions', []).append(node)
+            
+            # Headings only matter when the title element had no text
+            if (fields.get('title_text') and 'link' in fields and 'img' in fields
+                    and 'price' in fields and self._tile_description(fields) is not None):
+                break
+        
+        return fields
+    
+    def _tile_description(self, fields: Dict[str, Any]) -> Optional[Tag]:
+        """First description candidate from _scan_container that does not wrap the tile's link, title or price"""
+        parts = [fields[key] for key in ('link', 'title', 'price') + _TILE_HEADING_TAGS if key in fields]
+        for candidate in fields.get('descriptions', ()):
+            if not any(parent is candidate for part in parts for parent in part.parents):
+                return candidate
+        return None
+    
     def _parse_price(self, price_str: str) -> Optional[str]:
         """Parse price string"""
         if not price_str:
             return None
         # Extract numbers and currency symbols
-        match = re.search(r'[\d,.]+', price_str)
+        match = _RE_PRICE.search(price_str)
         return match.group(0) if match else None
 
     def _try_next_page(self, scraper) -> bool:
         """
         Smart pagination detection - tries multiple strategies to find and click next page
+        The candidate is chosen by one script in the browser instead of reading text/class/
+        aria-label of every link over separate WebDriver calls
         Returns True if successfully navigated to next page
         """
         if not self.config.get('smart_pagination', True):
             return False
         
-        try:
-            # Strategy 1: Look for "Next" button/link
-            next_selectors = [
-                ('a', {'class': re.compile(r'next', re.I)}),
-                ('a', {'rel': 'next'}),
-                ('button', {'class': re.compile(r'next', re.I)}),
-                ('a', {'aria-label': re.compile(r'next', re.I)})
-            ]
-            
-            for tag, attrs in next_selectors:
-                next_elem = scraper.driver.find_elements('css selector', f"{tag}")
-                for elem in next_elem:
-                    # Check if element text or attributes match "next"
-                    if ('next' in elem.text.lower() or 
-                        'next' in elem.get_attribute('class').lower() or
-                        'next' in (elem.get_attribute('aria-label') or '').lower()):
-                        # Check if not disabled
-                        if 'disabled' not in elem.get_attribute('class').lower():
-                            elem.click()
-                            time.sleep(2)
-                            return True
-            
-            # Strategy 2: Look for numbered pagination and click next number
-            current_page = scraper.driver.find_elements('css selector', '.page.current, .pagination .active, [aria-current="page"]')
-            if current_page:
-                try:
-                    current_num = int(current_page[0].text)
-                    next_page_link = scraper.driver.find_elements('css selector', f'a[href*="page={current_num + 1}"], a[href*="p={current_num + 1}"]')
-                    if next_page_link:
-                        next_page_link[0].click()
-                        time.sleep(2)
-                        return True
-                except:
-                    pass
+        script = """
+            function hasNext(value) { return (value || '').toLowerCase().indexOf('next') !== -1; }
+            
+            // Strategy 1: first visible-text/class/aria-label "next" link, then button, not disabled
+            var tags = ['a', 'button'];
+            for (var t = 0; t < tags.length; t++) {
+                var elems = document.getElementsByTagName(tags[t]);
+                for (var i = 0; i < elems.length; i++) {
+                    var el = elems[i];
+                    var cls = el.getAttribute('class') || '';
+                    var text = el.getClientRects().length ? el.innerText : '';
+                    if ((hasNext(text) || hasNext(cls) || hasNext(el.getAttribute('aria-label')))
+                            && cls.toLowerCase().indexOf('disabled') === -1) {
+                        return el;
+                    }
+                }
+            }
             
-            return False
+            // Strategy 2: numbered pagination - link to the page after the current one
+            var current = document.querySelector('.page.current, .pagination .active, [aria-current="page"]');
+            if (current && /^\s*[+-]?\d+\s*$/.test(current.innerText)) {
+                var next = parseInt(current.innerText, 10) + 1;
+                return document.querySelector('a[href*="page=' + next + '"], a[href*="p=' + next + '"]');
+            }
+            return null;
+        """
+        
+        try:
+            next_elem = scraper.driver.execute_script(script)
+            if next_elem is None:
+                return False
+            next_elem.click()
+            time.sleep(2)
+            return True
             
         except Exception as e:
             logger.debug(f"Pagination detection failed: {e}")
             return False
     
-    def _cross_collection_deduplicate(self, all_collections: Dict) -> Dict:
+    def _cross_collection_deduplicate(self, all_collections: Dict) -> Tuple[Dict, set]:
         """
         Deduplicate products across all collections
         Ensures each product appears in only one subcategory
+        Returns (collections, removed) where removed holds id() of every discarded product dict;
+        copies of one product share a source_url, so URLs cannot tell them apart
         """
-        product_map = {}  # URL -> (collection_name, product_data)
-        
-        # First pass: collect all products
+        subcat_flag = {name: data.get('subcategory') is not None for name, data in all_collections.items()}
+        deduplicated = {name: {**data, 'products': []} for name, data in all_collections.items()}
+        removed = set()
+        
+        if len(set(subcat_flag.values())) <= 1:
+            # Every collection is equally specific, so nothing can move - first collection listing a URL keeps it
+            first_seen = {}  # URL -> kept product
+            for coll_name, coll_data in all_collections.items():
+                products = deduplicated[coll_name]['products']
+                for product in coll_data.get('products', []):
+                    url = product.get('source_url')
+                    if not url:
+                        removed.add(id(product))
+                    elif url not in first_seen:
+                        first_seen[url] = product
+                        products.append(product)
+                    elif first_seen[url] is not product:
+                        removed.add(id(product))
+            
+            for entry in deduplicated.values():
+                entry['product_count'] = len(entry['products'])
+            return deduplicated, removed
+        
+        url_loc = {}  # URL -> (collection_name, index in that collection's deduplicated products)
+        
+        # Single pass: place every product straight into its final collection
         for coll_name, coll_data in all_collections.items():
-            products = coll_data.get('products', [])
-            for product in products:
+            current_has_subcat = subcat_flag[coll_name]
+            products = deduplicated[coll_name]['products']
+            for product in coll_data.get('products', []):
                 url = product.get('source_url')
-                if url:
-                    if url not in product_map:
-                        product_map[url] = (coll_name, product)
-                    else:
-                        # Product exists in multiple collections
-                        # Prefer subcategory over parent category
-                        existing_coll, existing_prod = product_map[url]
-                        
-                        # Check if current collection is more specific
-                        current_has_subcat = coll_data.get('subcategory') is not None
-                        existing_has_subcat = all_collections[existing_coll].get('subcategory') is not None
-                        
-                        if current_has_subcat and not existing_has_subcat:
-                            # Current is more specific, replace
-                            product_map[url] = (coll_name, product)
-                            logger.debug(f"Product {url} moved from '{existing_coll}' to '{coll_name}' (more specific)")
+                if not url:
+                    removed.add(id(product))
+                    continue
+                
+                existing = url_loc.get(url)
+                if existing is None:
+                    url_loc[url] = (coll_name, len(products))
+                    products.append(product)
+                    continue
+                
+                existing_coll, index = existing
+                existing_products = deduplicated[existing_coll]['products']
+                if existing_products[index] is product:
+                    continue  # Same dict listed twice - keep it where it is
+                
+                if current_has_subcat and not subcat_flag[existing_coll]:
+                    # Product exists in multiple collections - prefer subcategory over parent category
+                    removed.add(id(existing_products[index]))
+                    existing_products[index] = None  # Tombstone, compacted below
+                    url_loc[url] = (coll_name, len(products))
+                    products.append(product)
+                    logger.debug("Product %s moved from '%s' to '%s' (more specific)", url, existing_coll, coll_name)
+                else:
+                    removed.add(id(product))
         
-        # Second pass: rebuild collections with deduplicated products
-        deduplicated = {}
-        for coll_name, coll_data in all_collections.items():
-            deduplicated[coll_name] = coll_data.copy()
-            deduplicated[coll_name]['products'] = []
+        for entry in deduplicated.values():
+            entry['products'] = [product for product in entry['products'] if product is not None]
+            entry['product_count'] = len(entry['products'])
         
-        # Assign each product to its final collection
-        for url, (coll_name, product) in product_map.items():
-            deduplicated[coll_name]['products'].append(product)
+        return deduplicated, removed
+    
+    def _scrape_collections(self, collections: Dict, brand_name: str) -> Dict[str, List[Dict]]:
+        """Scrape every collection page, overlapping the downloads when parallel_collections is on"""
+        scraped = {}
         
-        # Update product counts
-        for coll_name in deduplicated:
-            deduplicated[coll_name]['product_count'] = len(deduplicated[coll_name]['products'])
+        if not (self.config.get('parallel_collections') and len(collections) > 1):
+            for coll_name, coll_info in collections.items():
+                logger.info(f"Scraping collection: {coll_name}")
+                scraped[coll_name] = self._scrape_collection_universal(
+                    coll_info['url'], brand_name, coll_info
+                )
+            return scraped
+        
+        logger.info(f"Scraping {len(collections)} collections with {self.config['max_workers']} workers")
+        pending = {}
+        for coll_name, coll_info in collections.items():
+            cached = self._cached_products(coll_info['url'], brand_name, coll_info)
+            if cached is not None:
+                scraped[coll_name] = cached
+            else:
+                pending[coll_name] = coll_info
         
-        return deduplicated
+        scraped.update(self._scrape_collections_parallel(pending, brand_name))
+        return scraped
+    
+    def _scrape_collections_parallel(self, collections: Dict, brand_name: str):
+        """Yield (collection_name, products) for each collection as soon as its page has been scraped"""
+        if not collections:
+            return
+        
+        # I/O bound - workers only download (rate limit is enforced per host) while this
+        # thread parses each page as it arrives, so parsing never contends for the GIL
+        with ThreadPoolExecutor(max_workers=self.config['max_workers']) as executor:
+            futures = {
+                executor.submit(self._get_html, coll_info['url']): coll_name
+                for coll_name, coll_info in collections.items()
+            }
+            for future in as_completed(futures):
+                coll_name = futures[future]
+                coll_info = collections[coll_name]
+                try:
+                    html = future.result()
+                except Exception as e:
+                    logger.error(f"Error scraping collection {coll_info['url']}: {e}")
+                    yield coll_name, []
+                    continue
+                yield coll_name, self._parse_collection_page(html, coll_info['url'], brand_name, coll_info)
     
     def _scrape_collection_universal(self, url: str, brand_name: str, coll_info: Dict) -> List[Dict]:
         """Universal collection scraper using requests (for static sites)"""
+        cached = self._cached_products(url, brand_name, coll_info)
+        if cached is not None:
+            return cached
+        
+        try:
+            html = self._get_html(url)
+        except Exception as e:
+            logger.error(f"Error scraping collection {url}: {e}")
+            return []
+        
+        return self._parse_collection_page(html, url, brand_name, coll_info)
+    
+    def _parse_collection_page(self, html, url: str, brand_name: str, coll_info: Dict) -> List[Dict]:
+        """Extract the products from a downloaded collection page"""
         products = []
         
         try:
-            # Check cache first
-            if self.config.get('enable_caching') and url in self._page_cache:
-                logger.debug(f"Using cached page for {url}")
-                soup = self._page_cache[url]
-            else:
-                response = requests.get(url, headers=self.headers, timeout=15)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                if self.config.get('enable_caching'):
-                    self._page_cache[url] = soup
+            soup = self._soup(html)
             
             # Extract products from page
             products = self._extract_products_from_page(soup, url, brand_name, coll_info)
+            self._cache_put(self._products_cache_key(url, brand_name, coll_info), products)
+            products = [product.copy() for product in products]
             
         except Exception as e:
             logger.error(f"Error scraping collection {url}: {e}")
         
         return products
+    
+    def _products_cache_key(self, url: str, brand_name: str, coll_info: Dict) -> Tuple:
+        """Cache key for a page's extracted products - they carry the brand and collection labels"""
+        return ('products', url, brand_name, coll_info.get('collection'),
+                coll_info.get('category'), coll_info.get('subcategory'))
+    
+    def _cached_products(self, url: str, brand_name: str, coll_info: Dict) -> Optional[List[Dict]]:
+        """Fresh copies of a page's previously extracted products, or None on a cache miss"""
+        products = self._cache_get(self._products_cache_key(url, brand_name, coll_info))
+        if products is None:
+            return None
+        
+        logger.debug("Using cached products for %s", url)
+        # Copies, so callers can enrich or deduplicate (by identity) without touching the cache
+        return [product.copy() for product in products]
 
     def _detect_dynamic_submenus_with_selenium(self, scraper, base_url: str):
         """
@@ -1393,23 +1954,24 @@ class UniversalBrandScraper:
         """
         try:
             from selenium.webdriver.common.action_chains import ActionChains
-            # Import By - use local import as primary, fallback to module-level if available
-            try:
-                from selenium.webdriver.common.by import By
-            except ImportError:
-                # Try to use module-level By if it exists
-                try:
-                    By = globals().get('By')
-                    if By is None:
-                        logger.warning("Selenium By is not available")
-                        return {}
-                except (NameError, KeyError):
-                    logger.warning("Selenium By is not available")
-                    return {}
+            
+            # Pages without any navigation (landing/detail pages) skip everything below after one cheap query
+            has_nav = scraper.driver.execute_script(
+                "return document.querySelector('nav, [class*=\"menu\"], [class*=\"nav\"]') !== null;"
+            )
+            if not has_nav:
+                logger.info("No navigation found on page, skipping dynamic submenu detection")
+                return {}
             
             logger.info("Extracting subcategories from dynamic menus...")
             
-            additional_collections = {}
+            # Fast path: most sites ship the whole submenu markup up front (hidden by CSS),
+            # so read it from the rendered DOM once instead of hovering anything
+            additional_collections = self._detect_submenus_from_source(scraper.driver.page_source, base_url)
+            if additional_collections:
+                logger.info(f"Successfully extracted {len(additional_collections)} subcategories from page source")
+                return additional_collections
+            
             actions = ActionChains(scraper.driver)
             
             # Find main navigation menu items
@@ -1422,108 +1984,82 @@ class UniversalBrandScraper:
                 "[class*='nav'] > li > a"
             ]
             
+            # One script per selector hovers every candidate with synthetic mouse events and reads
+            # the submenu it opens, instead of a WebDriver hover plus sleep per item.
+            # Rows are [item, text, has_submenu, links]; links is null when no submenu became visible
+            script = """
+                function visible(el) {
+                    return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+                        && getComputedStyle(el).visibility !== 'hidden';
+                }
+                var submenuSelectors = ['ul', '[class*="sub"]', '[class*="dropdown"]', '[class*="child"]'];
+                var items = Array.prototype.slice.call(document.querySelectorAll(arguments[0]), 0, arguments[1]);
+                return items.map(function (item) {
+                    if (!visible(item)) return null;
+                    ['mouseover', 'mouseenter'].forEach(function (type) {
+                        item.dispatchEvent(new MouseEvent(type, {bubbles: true}));
+                    });
+                    
+                    var li = item.parentElement, submenu = null, hasSubmenu = false;
+                    for (var i = 0; li && i < submenuSelectors.length; i++) {
+                        var candidate = li.querySelector(submenuSelectors[i]);
+                        if (candidate) {
+                            hasSubmenu = true;
+                            if (visible(candidate)) { submenu = candidate; break; }
+                        }
+                    }
+                    
+                    var links = submenu && Array.prototype.map.call(submenu.getElementsByTagName('a'), function (a) {
+                        return [a.innerText, a.getAttribute('href') === null ? null : a.href, visible(a)];
+                    });
+                    return [item, item.innerText, hasSubmenu, links];
+                });
+            """
+            
             for selector in nav_selectors:
+                # The script call is the only step that can fail (stale page, script error);
+                # everything after it is plain filtering of the returned rows
                 try:
-                    menu_items = scraper.driver.find_elements(By.CSS_SELECTOR, selector)
+                    menu_items = scraper.driver.execute_script(script, selector, 15)  # Limit to first 15 items
+                except Exception as e:
+                    logger.debug("Error with selector %s: %s", selector, e)
+                    continue
+                
+                if not menu_items:
+                    continue
+                
+                logger.debug("Found %d menu items with selector: %s", len(menu_items), selector)
+                
+                # Process each menu item
+                for entry in menu_items:
+                    if entry is None:  # Not displayed
+                        continue
                     
-                    if not menu_items or len(menu_items) == 0:
+                    item, parent_text, has_submenu, sublinks = entry
+                    parent_text = (parent_text or '').strip()
+                    if not parent_text or len(parent_text) > 50:
                         continue
                     
-                    logger.debug(f"Found {len(menu_items)} menu items with selector: {selector}")
+                    # Clean parent category name
+                    parent_category = self._clean_category_name(parent_text)
+                    if not parent_category:
+                        continue
                     
-                    # Process each menu item
-                    for item in menu_items[:15]:  # Limit to first 15 items
-                        try:
-                            if not item.is_displayed():
-                                continue
-                            
-                            parent_text = item.text.strip()
-                            if not parent_text or len(parent_text) > 50:
-                                continue
-                            
-                            # Clean parent category name
-                            parent_category = self._clean_category_name(parent_text)
-                            if not parent_category:
-                                continue
-                            
-                            # Hover over the item to reveal submenu
-                            actions.move_to_element(item).perform()
-                            time.sleep(0.7)  # Wait for dropdown
-                            
-                            # Look for submenu links
-                            try:
-                                # Find parent element (li)
-                                parent_li = item.find_element(By.XPATH, "..")
-                                
-                                # Look for submenu within parent
-                                submenu_selectors = [
-                                    ".//ul",
-                                    ".//*[contains(@class, 'sub')]",
-                                    ".//*[contains(@class, 'dropdown')]",
-                                    ".//*[contains(@class, 'child')]"
-                                ]
-                                
-                                submenu = None
-                                for sub_sel in submenu_selectors:
-                                    try:
-                                        submenu = parent_li.find_element(By.XPATH, sub_sel)
-                                        if submenu and submenu.is_displayed():
-                                            break
-                                    except:
-                                        continue
-                                
-                                if submenu and submenu.is_displayed():
-                                    # Extract all links from submenu
-                                    sublinks = submenu.find_elements(By.TAG_NAME, "a")
-                                    
-                                    for sublink in sublinks:
-                                        try:
-                                            if not sublink.is_displayed():
-                                                continue
-                                            
-                                            sub_text = sublink.text.strip()
-                                            sub_href = sublink.get_attribute("href")
-                                            
-                                            if not sub_text or not sub_href:
-                                                continue
-                                            
-                                            # Clean subcategory name
-                                            subcategory = self._clean_category_name(sub_text)
-                                            if not subcategory or subcategory == parent_category:
-                                                continue
-                                            
-                                            # Check if it's a valid category link
-                                            if self._is_category_link(sub_href, sub_text):
-                                                coll_key = f"{parent_category} > {subcategory}"
-                                                
-                                                if coll_key not in additional_collections:
-                                                    additional_collections[coll_key] = {
-                                                        'url': sub_href,
-                                                        'category': parent_category,
-                                                        'subcategory': subcategory
-                                                    }
-                                                    logger.info(f"✓ Found subcategory: {coll_key}")
-                                        
-                                        except Exception as e:
-                                            logger.debug(f"Error processing sublink: {e}")
-                                            continue
-                            
-                            except Exception as e:
-                                logger.debug(f"Error finding submenu for '{parent_text}': {e}")
-                                continue
-                        
-                        except Exception as e:
-                            logger.debug(f"Error processing menu item: {e}")
+                    if sublinks is None:
+                        if not has_submenu:
                             continue
+                        # Menu only opens on a real hover (CSS :hover, or handlers ignoring synthetic events)
+                        sublinks = self._hover_submenu_links(scraper, actions, item, parent_text)
                     
-                    # If we found subcategories with this selector, we're done
-                    if additional_collections:
-                        logger.info(f"Successfully extracted {len(additional_collections)} subcategories")
-                        break
-                        
-                except Exception as e:
-                    logger.debug(f"Error with selector {selector}: {e}")
-                    continue
+                    self._register_submenu_links(
+                        additional_collections, parent_category,
+                        ((sub_text, sub_href) for sub_text, sub_href, sub_displayed in sublinks if sub_displayed)
+                    )
+                
+                # If we found subcategories with this selector, we're done
+                if additional_collections:
+                    logger.info(f"Successfully extracted {len(additional_collections)} subcategories")
+                    break
             
             if not additional_collections:
                 logger.info("No dynamic subcategories found in navigation")
@@ -1533,4 +2069,103 @@ class UniversalBrandScraper:
         except Exception as e:
             logger.warning(f"Error detecting dynamic submenus: {e}")
             return {}
+    
+    def _detect_submenus_from_source(self, html, base_url: str) -> Dict:
+        """Read '<parent> > <sub>' collections straight from nav markup that is already in the DOM"""
+        doc = self._lxml_document(html)
+        if doc is None:
+            return {}
+        
+        collections = {}
+        for li in _XP_NAV_MENU_ITEMS(doc):
+            parent_text = ' '.join(_XP_MENU_ITEM_LINK(li)[0].text_content().split())
+            if not parent_text or len(parent_text) > 50:
+                continue
+            
+            parent_category = self._clean_category_name(parent_text)
+            if not parent_category:
+                continue
+            
+            links = []
+            for link in _XP_SUBMENU_LINKS(li):
+                href = link.get('href').strip()
+                # Fragment/script links would resolve to the page itself
+                if href and not href.startswith(_CATEGORY_EXCLUDE_PREFIXES):
+                    links.append((' '.join(link.text_content().split()), urljoin(base_url, href)))
+            self._register_submenu_links(collections, parent_category, links)
+        
+        return collections
+    
+    def _register_submenu_links(self, collections: Dict, parent_category: str, links) -> None:
+        """Add every (text, href) submenu link that points at a category as '<parent> > <sub>'"""
+        for sub_text, sub_href in links:
+            sub_text = (sub_text or '').strip()
+            if not sub_text or not sub_href:
+                continue
+            
+            # Clean subcategory name
+            subcategory = self._clean_category_name(sub_text)
+            if not subcategory or subcategory == parent_category:
+                continue
+            
+            # Check if it's a valid category link
+            if self._is_category_link(sub_href, sub_text):
+                coll_key = f"{parent_category} > {subcategory}"
+                
+                if coll_key not in collections:
+                    collections[coll_key] = {
+                        'url': sub_href,
+                        'category': parent_category,
+                        'subcategory': subcategory
+                    }
+                    logger.info("✓ Found subcategory: %s", coll_key)
+    
+    def _hover_submenu_links(self, scraper, actions, item, item_text: str) -> List[List]:
+        """Hover a menu item for real and read its submenu links as [text, href, displayed] rows"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+        
+        rows = []
+        
+        try:
+            # Look for a visible submenu within the parent (li) - the parent step and every
+            # candidate selector run in the browser, in one call, instead of a find_element each
+            probe = """
+                var li = arguments[0].parentElement;
+                var submenuSelectors = ['ul', '[class*="sub"]', '[class*="dropdown"]', '[class*="child"]'];
+                for (var i = 0; li && i < submenuSelectors.length; i++) {
+                    var candidate = li.querySelector(submenuSelectors[i]);
+                    if (candidate && (candidate.offsetWidth || candidate.offsetHeight || candidate.getClientRects().length)
+                            && getComputedStyle(candidate).visibility !== 'hidden') {
+                        return candidate;
+                    }
+                }
+                return null;
+            """
+            
+            # Hover over the item, then poll until its dropdown shows - most open in well under
+            # 100ms, so a fixed sleep was both too long and too short for slow menus
+            actions.move_to_element(item).perform()
+            try:
+                submenu = WebDriverWait(scraper.driver, 1.0, poll_frequency=0.1).until(
+                    lambda driver: driver.execute_script(probe, item)
+                )
+            except TimeoutException:
+                submenu = None
+            
+            if submenu:
+                # Extract all links from submenu - one script call instead of three per link
+                script = """
+                    return Array.prototype.map.call(arguments[0].getElementsByTagName('a'), function (a) {
+                        var shown = !!(a.offsetWidth || a.offsetHeight || a.getClientRects().length)
+                            && getComputedStyle(a).visibility !== 'hidden';
+                        return [a.innerText, a.getAttribute('href') === null ? null : a.href, shown];
+                    });
+                """
+                rows = scraper.driver.execute_script(script, submenu) or []
+        
+        except Exception as e:
+            logger.debug("Error finding submenu for '%s': %s", item_text, e)
+        
+        return rows
 